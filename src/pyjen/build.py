@@ -1,7 +1,6 @@
 """Primitives for interacting with Jenkins builds"""
 from datetime import datetime
 import logging
-from six.moves import urllib_parse
 from pyjen.changeset import Changeset
 
 
@@ -55,7 +54,7 @@ class Build(object):
         :rtype: :class:`int`
         """
 
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=number")
 
         return data['number']
 
@@ -68,7 +67,7 @@ class Build(object):
 
         """
 
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=timestamp")
 
         time_in_seconds = data['timestamp'] * 0.001
 
@@ -81,7 +80,7 @@ class Build(object):
         :returns: True if the build is executing otherwise False
         :rtype: :class:`bool`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=building")
         return data['building']
 
     @property
@@ -93,6 +92,23 @@ class Build(object):
         """
         return self._api.get_text("/consoleText")
 
+    def get_console_output_since(self, offset=0):
+        """Gets the console output produced by this build since a given point
+
+        Useful for following the output of a build while it is running,
+        without having to download the entire log each time it is checked.
+
+        :param int offset:
+            number of characters of the console output to skip. Defaults to 0,
+            which returns all output produced so far.
+        :returns:
+            3-tuple containing the new console output, the offset to use to
+            get the output produced after it, and a boolean indicating whether
+            the build may still produce more output
+        :rtype: :class:`tuple`
+        """
+        return self._api.get_progressive_text(offset)
+
     @property
     def result(self):
         """Gets the status of the build
@@ -108,7 +124,7 @@ class Build(object):
 
         :rtype: :class:`str`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=result")
         return data['result']
 
     @property
@@ -131,7 +147,7 @@ class Build(object):
 
         :rtype: :class:`str`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=description")
         retval = data["description"]
         if retval is None:
             return ""
@@ -143,7 +159,7 @@ class Build(object):
 
         :rtype: :class:`str`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=id")
         return data["id"]
 
     @property
@@ -152,16 +168,9 @@ class Build(object):
 
         :rtype: :class:`list` of :class:`str`
         """
-        data = self._api.get_api_data()
-        artifacts_node = data['artifacts']
-        retval = []
-
-        for node in artifacts_node:
-            url = urllib_parse.urljoin(
-                self._api.url, "artifact/" + node['fileName'])
-            retval.append(url)
-
-        return retval
+        data = self._api.get_api_data(query_params="tree=artifacts[fileName]")
+        artifact_root = self._api.url + "artifact/"
+        return [artifact_root + i['fileName'] for i in data['artifacts']]
 
     @property
     def duration(self):
@@ -171,7 +180,7 @@ class Build(object):
 
         :rtype: :class:`int`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=duration")
         return data['duration']
 
     @property
@@ -183,9 +192,32 @@ class Build(object):
 
         :rtype: :class:`int`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=estimatedDuration")
         return data['estimatedDuration']
 
+    @staticmethod
+    def instantiate(json_data, rest_api):
+        """Factory method for creating a PyJen build object from data loaded
+        from the Jenkins REST API
+
+        :param dict json_data:
+            data loaded from the Jenkins REST API summarizing the build to be
+            instantiated. Must contain the URL of the build, and may contain
+            the build number and the time stamp of when the build was started.
+        :param rest_api:
+            PyJen REST API configured for use by the parent container. Will
+            be used to instantiate the PyJen build that is returned.
+        :returns: PyJen build object wrapping the REST API for the given build
+        :rtype: :class:`~.build.Build`
+        """
+        # The build number and start time never change once a build has been
+        # started, so we pre-load them if they were included in the json data
+        # to avoid another hit to the REST API when they are queried
+        preloaded_data = dict(
+            (i, json_data[i]) for i in ("number", "timestamp")
+            if i in json_data)
+        return Build(rest_api.clone(json_data["url"], preloaded_data))
+
     def abort(self):
         """Aborts this build before it completes"""
         self._api.post(self._api.url + "stop")
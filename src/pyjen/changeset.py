@@ -36,12 +36,7 @@ class Changeset(object):
             this Changeset
         :rtype: :class:`list` of :class:`ChangesetItem` objects
         """
-        retval = []
-
-        for item in self._data['items']:
-            retval.append(ChangesetItem(self._api, item))
-
-        return retval
+        return [ChangesetItem(self._api, i) for i in self._data['items']]
 
     def __str__(self):  # pragma: no cover
         retval = ""
@@ -8,7 +8,8 @@ from pyjen.user import User
 from pyjen.queue import Queue
 from pyjen.plugin_manager import PluginManager
 from pyjen.utils.jenkins_api import JenkinsAPI
-from pyjen.utils.helpers import create_view, create_job
+from pyjen.utils.helpers import create_view, create_job, parallel_map, \
+    quote_name, DEFAULT_MAX_WORKERS
 
 
 class Jenkins(object):
@@ -60,6 +61,10 @@ class Jenkins(object):
         self._log = logging.getLogger(__name__)
         self._api = JenkinsAPI(url, credentials, ssl_cert)
 
+        # Name based indexes of the jobs and views on the dashboard, along
+        # with the REST API data they were generated from
+        self._indexes = dict()
+
     @property
     def connected(self):
         """make sure the connection to the Jenkins REST API was successful
@@ -93,7 +98,7 @@ class Jenkins(object):
             (ie: in quiet down state), return True, otherwise returns False.
         :rtype: :class:`bool`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=quietingDown")
 
         return data['quietingDown']
 
@@ -104,19 +109,65 @@ class Jenkins(object):
         :returns: list of 0 or more Node objects managed by this Jenkins master
         :rtype: :class:`list` of :class:`~.node.Node` objects
         """
-        data = self._api.get_api_data(target_url=self._api.url + "computer/")
-        nodes = data['computer']
-        retval = []
-        for cur_node in nodes:
-            if cur_node['displayName'] == 'master':
-                node_url = self._api.url + 'computer/(master)'
-            else:
-                node_url = self._api.url + 'computer/' + cur_node['displayName']
+        data = self._api.get_api_data(
+            target_url=self._api.url + "computer/",
+            query_params="tree=computer[displayName]")
+        return [self._make_node(i) for i in data['computer']]
+
+    def nodes_bulk_status(self):
+        """Gets a snapshot of the current state of all nodes managed by this
+        Jenkins master, using a single query
+
+        Use this in preference to querying the properties of each of the
+        objects returned by :py:attr:`nodes` when the state of many nodes is
+        needed at once, as that requires one query per node and property.
+
+        :returns:
+            list of dictionaries, one per node, with the following keys:
 
-            retval.append(Node(self._api.clone(node_url)))
+            * node - :class:`~.node.Node` object for the node
+            * offline - True if the node is offline, False if not
+            * idle - True if none of the executors of the node are in use
+            * num_executors - number of executors provided by the node
+        :rtype: :class:`list` of :class:`dict`
+        """
+        data = self._api.get_api_data(
+            target_url=self._api.url + "computer/",
+            query_params="tree=computer[displayName,offline,idle,numExecutors]")
 
+        retval = list()
+        for cur_node in data['computer']:
+            retval.append({
+                "node": self._make_node(cur_node),
+                "offline": cur_node['offline'],
+                "idle": cur_node['idle'],
+                "num_executors": cur_node['numExecutors'],
+            })
         return retval
 
+    def _make_node(self, node_data):
+        """Creates an object to manage a node listed by the REST API
+
+        :param dict node_data:
+            REST API data describing the node, containing at least its
+            display name
+        :rtype: :class:`~.node.Node`
+        """
+        node_url = self._node_url(node_data['displayName'])
+        preloaded_data = {"displayName": node_data['displayName']}
+        return Node(self._api.clone(node_url, preloaded_data))
+
+    def _node_url(self, node_name):
+        """Generates the REST API URL for a build agent managed by Jenkins
+
+        :param str node_name: the name of the agent
+        :rtype: :class:`str`
+        """
+        # The REST API endpoint for the master node is not named after it
+        if node_name == "master":
+            node_name = "(master)"
+        return self._api.url + "computer/" + node_name
+
     @property
     def default_view(self):
         """returns a reference to the primary / default Jenkins view
@@ -127,7 +178,8 @@ class Jenkins(object):
         :returns: object that manages the default Jenkins view
         :rtype: :class:`~.view.View`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=primaryView[name,url]", cache=True)
 
         return View.instantiate(data['primaryView'], self._api)
 
@@ -142,14 +194,10 @@ class Jenkins(object):
         :returns: list of one or more views defined on this Jenkins instance.
         :rtype: :class:`list` of :class:`~.view.View` objects
         """
-        retval = list()
-
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=views[name,url]", cache=True)
 
-        for cur_view in data['views']:
-            retval.append(View.instantiate(cur_view, self._api))
-
-        return retval
+        return [View.instantiate(i, self._api) for i in data['views']]
 
     @property
     def jobs(self):
@@ -157,13 +205,10 @@ class Jenkins(object):
 
         :rtype:  :class:`list` of :class:`~.job.Job` objects
         """
-        data = self._api.get_api_data(query_params="depth=0")
+        data = self._api.get_api_data(
+            query_params="tree=jobs[name,url]", cache=True)
 
-        retval = list()
-        for j in data['jobs']:
-            retval.append(Job.instantiate(j, self._api))
-
-        return retval
+        return [Job.instantiate(j, self._api) for j in data['jobs']]
 
     def _recursively_find_jobs(self, obj):
         """Recursively locates all jobs managed by an arbitrary Jenkins object
@@ -212,6 +257,40 @@ class Jenkins(object):
         """
         self._api.post(self._api.url + 'cancelQuietDown')
 
+    def refresh(self):
+        """Discards any REST API data cached for this Jenkins instance
+
+        Listings of jobs and views are cached for a few seconds to avoid
+        redundant queries, and the cache is discarded automatically whenever
+        changes are made through PyJen. This method only needs to be called to
+        see changes made to the Jenkins instance by other clients within
+        that time frame.
+        """
+        self._api.invalidate()
+
+    def _get_index(self, item_type):
+        """Gets an index of the items of a given type on the dashboard, by name
+
+        The index is generated once for each set of data loaded from the REST
+        API, so repeated searches against the same cached data don't need to
+        scan the entire list of items each time.
+
+        :param str item_type:
+            the type of dashboard item to index, either 'jobs' or 'views'
+        :returns:
+            dictionary mapping the name of each item to the REST API data
+            describing it
+        :rtype: :class:`dict`
+        """
+        data = self._api.get_api_data(
+            query_params="tree={0}[name,url]".format(item_type), cache=True)
+
+        source_data, index = self._indexes.get(item_type, (None, None))
+        if source_data is not data:
+            index = dict((i['name'], i) for i in data[item_type])
+            self._indexes[item_type] = (data, index)
+        return index
+
     def find_job(self, job_name):
         """Searches all jobs managed by this Jenkins instance for a specific job
 
@@ -223,13 +302,10 @@ class Jenkins(object):
             the job will be returned, otherwise None
         :rtype: :class:`~.job.Job`
         """
-        data = self._api.get_api_data()
-
-        for cur_job in data['jobs']:
-            if cur_job['name'] == job_name:
-                return Job.instantiate(cur_job, self._api)
-
-        return None
+        cur_job = self._get_index("jobs").get(job_name)
+        if cur_job is None:
+            return None
+        return Job.instantiate(cur_job, self._api)
 
     def find_view(self, view_name):
         """Searches views for a specific one
@@ -242,14 +318,46 @@ class Jenkins(object):
             the view will be returned, otherwise None
         :rtype: :class:`~.view.View`
         """
-        data = self._api.get_api_data()
+        cur_view = self._get_index("views").get(view_name)
+        if cur_view is None:
+            return None
+        return View.instantiate(cur_view, self._api)
 
-        for cur_view in data['views']:
-            temp_view = View.instantiate(cur_view, self._api)
-            if temp_view.name == view_name:
-                return temp_view
+    def find_jobs_bulk(self, job_names):
+        """Searches for several jobs managed by this Jenkins instance at once
 
-        return None
+        All of the jobs are located using a single query to the REST API, so
+        this is much more efficient than calling :py:meth:`.find_job` once for
+        each job.
+
+        :param job_names: sequence of names of the jobs to search for
+        :returns:
+            list of objects to manage the jobs, in the same order as the names
+            they were found from. Contains None for any job that could not be
+            found.
+        :rtype: :class:`list` of :class:`~.job.Job`
+        """
+        index = self._get_index("jobs")
+        return [Job.instantiate(index[i], self._api) if i in index else None
+                for i in job_names]
+
+    def find_views_bulk(self, view_names):
+        """Searches for several views on the Jenkins dashboard at once
+
+        All of the views are located using a single query to the REST API, so
+        this is much more efficient than calling :py:meth:`.find_view` once
+        for each view.
+
+        :param view_names: sequence of names of the views to search for
+        :returns:
+            list of objects to manage the views, in the same order as the names
+            they were found from. Contains None for any view that could not be
+            found.
+        :rtype: :class:`list` of :class:`~.view.View`
+        """
+        index = self._get_index("views")
+        return [View.instantiate(index[i], self._api) if i in index else None
+                for i in view_names]
 
     def create_view(self, view_name, view_class):
         """Creates a new view on the Jenkins dashboard
@@ -263,11 +371,7 @@ class Jenkins(object):
         :returns: An object to manage the newly created view
         :rtype: :class:`~.view.View`
         """
-
-        create_view(self._api, view_name, view_class)
-        retval = self.find_view(view_name)
-        assert retval is not None
-        return retval
+        return create_view(self._api, view_name, view_class)
 
     def create_job(self, job_name, job_class):
         """Creates a new job on the Jenkins dashboard
@@ -281,11 +385,39 @@ class Jenkins(object):
         :returns: An object to manage the newly created job
         :rtype: :class:`~.job.Job`
         """
-        create_job(self._api, job_name, job_class)
+        return create_job(self._api, job_name, job_class)
 
-        retval = self.find_job(job_name)
-        assert retval is not None
-        return retval
+    def bulk_create_jobs(self, specs, max_workers=DEFAULT_MAX_WORKERS):
+        """Creates several new jobs on the Jenkins dashboard, concurrently
+
+        Failing to create one job does not prevent the others from being
+        created. Any errors encountered are returned alongside the
+        specification for the job that failed.
+
+        :param specs:
+            sequence of 2-tuples, each containing the name for a new job and
+            the PyJen plugin class associated with the type of job to create
+        :param int max_workers:
+            maximum number of jobs to create at the same time
+        :returns:
+            list of 2-tuples, one for each of the given specifications in the
+            same order, containing the specification and either an object to
+            manage the newly created job or the exception raised when
+            attempting to create it
+        :rtype: :class:`list` of :class:`tuple`
+        """
+        def create(spec):
+            """Creates a single job, capturing any errors"""
+            # Errors are not limited to failed requests. Invalid job types
+            # or configurations may raise all sorts of exceptions, none of
+            # which should prevent the remaining jobs from being created.
+            try:
+                return spec, self.create_job(*spec)
+            except Exception as err:  # pylint: disable=broad-except
+                self._log.error("Failed to create job %s: %s", spec[0], err)
+                return spec, err
+
+        return parallel_map(create, specs, max_workers)
 
     def find_user(self, username):
         """Locates a user with the given username on this Jenkins instance
@@ -295,17 +427,18 @@ class Jenkins(object):
             reference to Jenkins object that manages this users information.
         :rtype: :class:`~.user.User` or None if user not found
         """
-        # TODO: Rework 'users' property to cache the user name for all users in
-        #       one query, so we can rework this implementation to simply call
-        #       self.users then iterate through them all to find the one
-        #       we're looking for. Then we don't have to guess the URL.
-        new_url = self._api.url + "user/" + username
+        # Listing all users on the dashboard is very expensive on large
+        # instances, so we look the user up directly from the URL we expect
+        # it to have, and make sure the REST API agrees with our guess
+        new_url = self._api.url + "user/" + quote_name(username)
         try:
-            retval = User(self._api.clone(new_url))
-            assert retval.user_id == username
-            return retval
+            data = self._api.get_api_data(
+                target_url=new_url, query_params="tree=id")
         except RequestException:
             return None
+        if data['id'] != username:
+            return None
+        return User(self._api.clone(new_url, {"id": data['id']}))
 
     def find_node(self, nodename):
         """Locates a Jenkins build agent with the given name
@@ -315,23 +448,13 @@ class Jenkins(object):
             reference to Jenkins object that manages this node's information.
         :rtype: :class:`~.node.Node` or None if node not found
         """
-        if nodename == "master":
-            temp_nodename = "(master)"
-        else:
-            temp_nodename = nodename
-
-        # TODO: Rework 'nodes' property to cache the node name for all nodes in
-        #       one query, so we can rework this implementation to simply call
-        #       self.nodes then iterate through them all to find the one
-        #       we're looking for. Then we don't have to guess the URL.
-
-        new_url = self._api.url + "computer/" + temp_nodename
-        try:
-            retval = Node(self._api.clone(new_url))
-            assert retval.name == nodename
-            return retval
-        except RequestException:
-            return None
+        data = self._api.get_api_data(
+            target_url=self._api.url + "computer/",
+            query_params="tree=computer[displayName]")
+        for cur_node in data['computer']:
+            if cur_node['displayName'] == nodename:
+                return self._make_node(cur_node)
+        return None
 
     @property
     def plugin_manager(self):
@@ -1,11 +1,14 @@
 """Primitives for interacting with Jenkins jobs"""
+from datetime import datetime
 import logging
 from six.moves import urllib_parse
 import requests
 from requests.exceptions import HTTPError
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.build import Build
 from pyjen.queue_item import QueueItem
 from pyjen.utils.jobxml import JobXML
+from pyjen.utils.helpers import XML_HEADERS, quote_name
 from pyjen.utils.plugin_api import find_plugin, get_all_plugins
 
 
@@ -20,6 +23,7 @@ class Job(object):
         super(Job, self).__init__()
         self._api = api
         self._xml_cache = None
+        self._parent_info = None
         self._log = logging.getLogger(self.__module__)
 
     def __repr__(self):
@@ -108,7 +112,7 @@ class Job(object):
         :returns: The name of the job
         :rtype: :class:`str`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=name")
         return data['name']
 
     @property
@@ -118,7 +122,7 @@ class Job(object):
         :returns: True if the job is disabled, otherwise False
         :rtype: :class:`bool`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=color")
 
         return data['color'] == "disabled"
 
@@ -130,7 +134,7 @@ class Job(object):
             True if the latest build of the job is unsable, otherwise False
         :rtype: :class:`bool`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=color")
 
         return data['color'] == "yellow"
 
@@ -142,7 +146,7 @@ class Job(object):
             True if the latest build of the job is a failure, otherwise False
         :rtype: :class:`bool`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=color")
         return data['color'] == "red"
 
     @property
@@ -152,7 +156,7 @@ class Job(object):
         :returns: True if the job has been built at least once, otherwise false
         :rtype: :class:`bool`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=color")
 
         return data['color'] != "notbuilt"
 
@@ -168,16 +172,10 @@ class Job(object):
         :returns: a list of the most recent builds for this job
         :rtype: :class:`list` of :class:`~.build.Build` objects
         """
-        data = self._api.get_api_data(query_params="depth=2")
+        data = self._api.get_api_data(
+            query_params="tree=builds[url,number,timestamp]")
 
-        builds = data['builds']
-
-        retval = list()
-        for cur_build in builds:
-            temp_build = Build(self._api.clone(cur_build['url']))
-            retval.append(temp_build)
-
-        return retval
+        return [Build.instantiate(i, self._api) for i in data['builds']]
 
     @property
     def all_builds(self):
@@ -186,16 +184,10 @@ class Job(object):
         :returns: all recorded builds for this job
         :rtype: :class:`list` of :class:`~.build.Build` objects
         """
-        data = self._api.get_api_data(query_params="tree=allBuilds[url]")
+        data = self._api.get_api_data(
+            query_params="tree=allBuilds[url,number,timestamp]")
 
-        builds = data['allBuilds']
-
-        retval = list()
-        for cur_build in builds:
-            temp_build = Build(self._api.clone(cur_build['url']))
-            retval.append(temp_build)
-
-        return retval
+        return [Build.instantiate(i, self._api) for i in data['allBuilds']]
 
     @property
     def last_good_build(self):
@@ -211,14 +203,15 @@ class Job(object):
             this method returns None
         :rtype: :class:`~.build.Build`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=lastSuccessfulBuild[url,number,timestamp]")
 
         lgb = data['lastSuccessfulBuild']
 
         if lgb is None:
             return None
 
-        return Build(self._api.clone(lgb['url']))
+        return Build.instantiate(lgb, self._api)
 
     @property
     def last_build(self):
@@ -234,13 +227,14 @@ class Job(object):
             this method returns None
         :rtype: :class:`~.build.Build`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=lastBuild[url,number,timestamp]")
 
         if 'lastBuild' not in data or data['lastBuild'] is None:
             return None
         last_build = data['lastBuild']
 
-        return Build(self._api.clone(last_build['url']))
+        return Build.instantiate(last_build, self._api)
 
     @property
     def last_failed_build(self):
@@ -254,14 +248,15 @@ class Job(object):
             builds in the build history, this method returns None
         :rtype: :class:`~.build.Build`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=lastFailedBuild[url,number,timestamp]")
 
         bld = data['lastFailedBuild']
 
         if bld is None:
             return None
 
-        return Build(self._api.clone(bld['url']))
+        return Build.instantiate(bld, self._api)
 
     @property
     def last_stable_build(self):
@@ -275,14 +270,15 @@ class Job(object):
             builds in the build history, this method returns None
         :rtype: :class:`~.build.Build`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=lastCompletedBuild[url,number,timestamp]")
 
         bld = data['lastCompletedBuild']
 
         if bld is None:
             return None
 
-        return Build(self._api.clone(bld['url']))
+        return Build.instantiate(bld, self._api)
 
     @property
     def last_unsuccessful_build(self):
@@ -296,14 +292,15 @@ class Job(object):
             builds in the build history, this method returns None
         :rtype: :class:`~.build.Build`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=lastUnsuccessfulBuild[url,number,timestamp]")
 
         bld = data['lastUnsuccessfulBuild']
 
         if bld is None:
             return None
 
-        return Build(self._api.clone(bld['url']))
+        return Build.instantiate(bld, self._api)
 
     def find_build_by_queue_id(self, queue_id):
         """Gets the build of this job which correlates to a specific queue item
@@ -397,16 +394,21 @@ class Job(object):
         #       require 1 hit to the REST API but would be more robust than
         #       trying to "guess" the correct URL endpoint
         temp_url = self._api.url + str(build_number)
-        retval = Build(self._api.clone(temp_url))
 
         # query the REST API to make sure the URL is correct and that it
         # returns the correct build number
         try:
-            assert retval.number == build_number
-        except:  # pylint: disable=broad-except,bare-except
+            data = self._api.get_api_data(
+                target_url=temp_url, query_params="tree=number")
+        except HTTPError as err:
+            if err.response.status_code == requests.codes.NOT_FOUND:
+                return None
+            raise
+
+        if data['number'] != build_number:
             return None
 
-        return retval
+        return Build(self._api.clone(temp_url, data))
 
     def get_builds_in_time_range(self, start_time, end_time):
         """ Returns a list of all of the builds for a job that
@@ -422,13 +424,21 @@ class Job(object):
         if start_time > end_time:
             end_time, start_time = start_time, end_time
 
+        # Load the start times of all builds in a single request so we only
+        # need to create objects for the builds within the given range
+        data = self._api.get_api_data(
+            query_params="tree=allBuilds[url,number,timestamp]")
+
         builds = list()
+        for cur_build in data['allBuilds']:
+            build_time = datetime.fromtimestamp(cur_build['timestamp'] * 0.001)
 
-        for run in self.all_builds:
-            if run.start_time < start_time:
+            # builds are sorted from newest to oldest so once we find one that
+            # was started before the range we know the rest will be as well
+            if build_time < start_time:
                 break
-            elif end_time >= run.start_time >= start_time:
-                builds.append(run)
+            if build_time <= end_time:
+                builds.append(Build.instantiate(cur_build, self._api))
         return builds
 
     @property
@@ -441,7 +451,8 @@ class Job(object):
         :return: percentage of good builds on record for this job
         :rtype: :class:`int`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=healthReport[description,score]")
 
         health_report = data['healthReport']
 
@@ -462,34 +473,73 @@ class Job(object):
         :returns: reference to the newly created job
         :rtype: :class:`pyjen.job.Job`
         """
-        # NOTE: In order to properly support jobs that may contain nested
-        #       jobs we have to do some URL manipulations to extrapolate the
-        #       REST API endpoint for the parent object to which the cloned
-        #       view is to be contained.
-        parts = urllib_parse.urlsplit(self._api.url).path.split("/")
-        parts = [cur_part for cur_part in parts if cur_part.strip()]
-        assert len(parts) >= 2
-        assert parts[-2] == "job"
-        parent_url = urllib_parse.urljoin(
-            self._api.url, "/" + "/".join(parts[:-2]))
-
+        parent_url, job_name = self._get_parent_info()
         parent_api = self._api.clone(parent_url)
-        args = {
-            "params": {
-                "name": new_job_name,
-                "mode": "copy",
-                "from": self.name
+
+        # When the new job is to be disabled we upload a copy of our config
+        # with the disabled flag already set, so the job gets created in
+        # the disabled state with a single request and never has a chance
+        # to trigger. Job types with no such flag, and users who are not
+        # allowed to read the config, fall back to a copy operation
+        # followed by a separate disable request.
+        disabled_xml = self._get_disabled_xml() if disable else None
+        if disabled_xml is not None:
+            args = {
+                "data": disabled_xml,
+                "params": {"name": new_job_name},
+                "headers": XML_HEADERS
+            }
+        else:
+            args = {
+                "params": {
+                    "name": new_job_name,
+                    "mode": "copy",
+                    "from": job_name
+                }
             }
-        }
         parent_api.post(parent_api.url + "createItem", args=args)
 
-        new_url = parent_api.url + "job/" + new_job_name
-        new_api = self._api.clone(new_url)
+        new_url = parent_api.url + "job/" + quote_name(new_job_name)
+        new_api = self._api.clone(new_url, {"name": new_job_name})
         new_job = self.__class__(new_api)
-        if disable:
+        if disable and disabled_xml is None:
             new_job.disable()
         return new_job
 
+    def _get_disabled_xml(self):
+        """Generates a copy of the config.xml for this job with the job
+        disabled
+
+        The configuration is loaded fresh from Jenkins rather than taken from
+        the cached copy managed by this object, so the copy matches what
+        Jenkins would produce when copying the job itself.
+
+        :returns:
+            XML configuration for a disabled copy of this job, or None if this
+            type of job has no disabled flag in its configuration or the
+            configuration can not be read with the current credentials
+        :rtype: :class:`str`
+        """
+        try:
+            stream = self._api.get_raw("/config.xml")
+        except HTTPError as err:
+            if err.response.status_code in (requests.codes.UNAUTHORIZED,
+                                            requests.codes.FORBIDDEN):
+                self._log.debug("Unable to read config for job %s",
+                                self._api.url)
+                return None
+            raise
+        try:
+            root = ElementTree.parse(stream).getroot()
+        finally:
+            stream.close()
+
+        disabled_node = root.find("disabled")
+        if disabled_node is None:
+            return None
+        disabled_node.text = "true"
+        return ElementTree.tostring(root).decode("utf-8")
+
     def rename(self, new_job_name):
         """Changes the name of this job
 
@@ -503,20 +553,40 @@ class Job(object):
         }
         self._api.post(self._api.url + "doRename", args=args)
 
+        parent_url, _ = self._get_parent_info()
+        new_url = parent_url + "job/" + quote_name(new_job_name)
+        self._api = self._api.clone(new_url, {"name": new_job_name})
+        self._parent_info = (parent_url, new_job_name)
+
+    def _get_parent_info(self):
+        """Gets the URL of the parent object containing this job, and the
+        name of the job
+
+        The results are derived from the URL of the job rather than queried
+        from the REST API, and are computed only once for each job instance.
+
+        :returns:
+            2-tuple containing the URL of the parent, with a trailing slash,
+            and the decoded name of this job as encoded in its URL
+        :rtype: :class:`tuple`
+        """
+        if self._parent_info is not None:
+            return self._parent_info
+
         # NOTE: In order to properly support jobs that may contain nested
         #       jobs we have to do some URL manipulations to extrapolate the
-        #       REST API endpoint for the parent object to which the cloned
-        #       view is to be contained.
+        #       REST API endpoint for the parent object to which this job
+        #       is contained.
         parts = urllib_parse.urlsplit(self._api.url).path.split("/")
         parts = [cur_part for cur_part in parts if cur_part.strip()]
         assert len(parts) >= 2
         assert parts[-2] == "job"
-        new_url = urllib_parse.urljoin(
+        parent_url = urllib_parse.urljoin(
             self._api.url, "/" + "/".join(parts[:-2]))
-        new_url += "/job/" + new_job_name
-        self._api = self._api.clone(new_url)
-
-        assert self.name == new_job_name
+        if not parent_url.endswith("/"):
+            parent_url += "/"
+        self._parent_info = (parent_url, urllib_parse.unquote(parts[-1]))
+        return self._parent_info
 
     # --------------------------------------------------------------- PLUGIN API
     @staticmethod
@@ -534,11 +604,6 @@ class Job(object):
             PyJen view object wrapping the REST API for the given Jenkins view
         :rtype: :class:`~.view.View`
         """
-        # TODO: Find some way to cache the json data given inside the view so
-        #       we can lazy-load API data. For example, the name of the view
-        #       is always included in the json data and therefore queries for
-        #       the View name after creation should not require another hit
-        #       to the REST API
         log = logging.getLogger(__name__)
 
         job_url = json_data["url"]
@@ -566,7 +631,12 @@ class Job(object):
             log.debug("Unable to find plugin for class %s", json_data["_class"])
             plugin_class = Job
 
-        return plugin_class(rest_api.clone(job_url))
+        # The name of the job is typically included in the json data so we
+        # pre-load it to avoid another hit to the REST API when it is queried
+        preloaded_data = None
+        if "name" in json_data:
+            preloaded_data = {"name": json_data["name"]}
+        return plugin_class(rest_api.clone(job_url, preloaded_data))
 
     @classmethod
     def get_supported_plugins(cls):
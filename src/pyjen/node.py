@@ -2,6 +2,10 @@
 import time
 from six.moves import urllib_parse
 
+# Upper limit, in seconds, for the delay between successive checks of the
+# state of a node when waiting for it to change
+MAX_POLLING_INTERVAL = 16
+
 
 class Node(object):
     """Wrapper around a Jenkins build agent (aka: Node) configuration
@@ -25,7 +29,7 @@ class Node(object):
 
         :rtype: :class:`str`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=displayName")
 
         return data['displayName']
 
@@ -35,7 +39,7 @@ class Node(object):
 
         :rtype: :class:`bool`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=offline")
 
         return data['offline']
 
@@ -45,7 +49,7 @@ class Node(object):
 
         :rtype: :class:`bool`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=idle")
         return data['idle']
 
     @property
@@ -54,7 +58,7 @@ class Node(object):
 
         :rtype: :class:`int`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=numExecutors")
         return data['numExecutors']
 
     def toggle_offline(self, message=None):
@@ -73,31 +77,40 @@ class Node(object):
 
         self._api.post(post_cmd)
 
-    def wait_for_idle(self, max_timeout=None):
+    def wait_for_idle(self, max_timeout=None, interval=1,
+                      max_interval=MAX_POLLING_INTERVAL):
         """Blocks execution until this Node enters an idle state
 
+        The state of the node is polled with an exponentially increasing
+        delay between each check, starting from the given interval, to avoid
+        needlessly loading the Jenkins server during long waits.
+
         :param int max_timeout:
             The maximum amount of time, in seconds, to wait for an idle state.
             If this value is undefined, this method will block indefinitely.
-
+        :param float interval:
+            Initial delay, in seconds, between each check of the node state
+        :param float max_interval:
+            Upper limit, in seconds, for the delay between each check of the
+            node state
         :returns:
             True if the Node has entered idle state before returning
             otherwise returns False
         :rtype: :class:`bool`
         """
-        polling_period_in_seconds = 1
-
-        total_wait_time = 0
+        start_time = time.time()
+        delay = interval
         while not self.is_idle:
-            time.sleep(polling_period_in_seconds)
-            if max_timeout is None:
-                continue
+            if max_timeout is not None:
+                remaining = max_timeout - (time.time() - start_time)
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
 
-            total_wait_time += polling_period_in_seconds
-            if total_wait_time >= max_timeout:
-                break
+            time.sleep(delay)
+            delay = min(delay * 2, max_interval)
 
-        return self.is_idle
+        return True
 
 
 if __name__ == "__main__":  # pragma: no cover
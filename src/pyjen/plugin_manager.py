@@ -24,12 +24,7 @@ class PluginManager(object):
         :rtype: List of 0 or more :class:`~.plugin.Plugin` objects"""
         res = self._api.get_api_data(query_params='depth=2')
 
-        retval = []
-
-        for cur_plugin in res['plugins']:
-            tmp_plugin = Plugin(cur_plugin)
-            retval.append(tmp_plugin)
-        return retval
+        return [Plugin(i) for i in res['plugins']]
 
     def find_plugin_by_shortname(self, short_name):
         """Finds an installed plugin based on it's abbreviated name
@@ -1,6 +1,21 @@
 """Interface to the Jenkins 'build trigger' publishing plugin"""
-import xml.etree.ElementTree as ElementTree
+import copy
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.utils.xml_plugin import XMLPlugin
+from pyjen.utils.helpers import split_names
+
+# Default configuration for new build triggers, which run when the parent
+# job is successful. Parsed once at import time and copied for each new
+# trigger.
+DEFAULT_TRIGGER_NODE = ElementTree.fromstring("""
+<hudson.tasks.BuildTrigger>
+    <threshold>
+        <name>SUCCESS</name>
+        <ordinal>0</ordinal>
+        <color>BLUE</color>
+        <completeBuild>true</completeBuild>
+    </threshold>
+</hudson.tasks.BuildTrigger>""")
 
 
 class BuildTriggerPublisher(XMLPlugin):
@@ -26,9 +41,8 @@ class BuildTriggerPublisher(XMLPlugin):
 
         :rtype: :class:`list` of :class:`str`
         """
-
         children_node = self._root.find('childProjects')
-        return [i.strip() for i in children_node.text.split(",")]
+        return split_names(children_node.text)
 
     @classmethod
     def instantiate(cls, project_names):
@@ -41,16 +55,7 @@ class BuildTriggerPublisher(XMLPlugin):
         :rtype:
             :class:`pyjen.plugins.buildtriggerpublisher.BuildTriggerPublisher`
         """
-        default_xml = """
-<hudson.tasks.BuildTrigger>
-    <threshold>
-        <name>SUCCESS</name>
-        <ordinal>0</ordinal>
-        <color>BLUE</color>
-        <completeBuild>true</completeBuild>
-    </threshold>
-</hudson.tasks.BuildTrigger>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = copy.deepcopy(DEFAULT_TRIGGER_NODE)
 
         child = ElementTree.SubElement(root_node, "childProjects")
         child.text = ",".join(project_names)
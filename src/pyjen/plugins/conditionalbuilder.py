@@ -1,6 +1,6 @@
 """Primitives for operating on Jenkins job builder of type 'Conditional Builder'
 """
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.utils.plugin_api import find_plugin
 from pyjen.utils.xml_plugin import XMLPlugin
 
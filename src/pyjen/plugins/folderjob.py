@@ -11,13 +11,10 @@ class FolderJob(Job):
 
         :rtype: :class:`list` of :class:`~.job.Job`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=jobs[name,url]", cache=True)
 
-        retval = list()
-        for tjob in data['jobs']:
-            retval.append(Job.instantiate(tjob, self._api))
-
-        return retval
+        return [Job.instantiate(j, self._api) for j in data['jobs']]
 
     def create_job(self, job_name, job_class):
         """Creates a new job on the Jenkins dashboard
@@ -31,10 +28,7 @@ class FolderJob(Job):
         :returns: An object to manage the newly created job
         :rtype: :class:`~.job.Job`
         """
-        create_job(self._api, job_name, job_class)
-        retval = self.find_job(job_name)
-        assert retval is not None
-        return retval
+        return create_job(self._api, job_name, job_class)
 
     def find_job(self, job_name):
         """Searches all jobs managed by this Jenkins instance for a specific job
@@ -47,7 +41,8 @@ class FolderJob(Job):
             the job will be returned, otherwise None
         :rtype: :class:`~.job.Job`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=jobs[name,url]", cache=True)
         tjobs = data['jobs']
 
         for tjob in tjobs:
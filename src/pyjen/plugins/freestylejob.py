@@ -1,6 +1,7 @@
 """Primitives that manage Jenkins job of type 'Freestyle'"""
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.job import Job
+from pyjen.utils.helpers import parallel_map
 from pyjen.utils.jobxml import JobXML
 from pyjen.utils.plugin_api import find_plugin
 
@@ -136,16 +137,10 @@ class FreestyleJob(Job):
         :returns: A list of 0 or more jobs that this job depends on
         :rtype: :class:`list` of :class:`~.job.Job` objects
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(
+            query_params="tree=upstreamProjects[name,url]")
 
-        jobs = data['upstreamProjects']
-
-        retval = list()
-
-        for j in jobs:
-            retval.append(Job.instantiate(j, self._api))
-
-        return retval
+        return [Job.instantiate(j, self._api) for j in data['upstreamProjects']]
 
     @property
     def all_upstream_jobs(self):
@@ -157,11 +152,7 @@ class FreestyleJob(Job):
         :returns: A list of 0 or more jobs this job depend on
         :rtype:  :class:`list` of :class:`~.job.Job` objects
         """
-
-        retval = self.upstream_jobs
-        for cur_job in retval:
-            retval.extend(cur_job.all_upstream_jobs)
-        return retval
+        return self._all_dependencies('upstreamProjects')
 
     @property
     def downstream_jobs(self):
@@ -170,16 +161,11 @@ class FreestyleJob(Job):
         :returns: A list of 0 or more jobs which depend on this one
         :rtype:  :class:`list` of :class:`~.job.Job` objects
         """
-        data = self._api.get_api_data()
-
-        jobs = data['downstreamProjects']
-
-        retval = list()
+        data = self._api.get_api_data(
+            query_params="tree=downstreamProjects[name,url]")
 
-        for j in jobs:
-            retval.append(Job.instantiate(j, self._api))
-
-        return retval
+        return [Job.instantiate(j, self._api)
+                for j in data['downstreamProjects']]
 
     @property
     def all_downstream_jobs(self):
@@ -191,9 +177,61 @@ class FreestyleJob(Job):
         :returns: A list of 0 or more jobs which depend on this one
         :rtype:  :class:`list` of :class:`~.job.Job` objects
         """
-        retval = self.downstream_jobs
-        for cur_job in retval:
-            retval.extend(cur_job.all_downstream_jobs)
+        return self._all_dependencies('downstreamProjects')
+
+    def _all_dependencies(self, field):
+        """Gets all jobs linked to this one by a given type of dependency,
+        recursively
+
+        :param str field:
+            name of the REST API field that lists the direct dependencies of a
+            job. Either 'upstreamProjects' or 'downstreamProjects'.
+        :returns: A list of 0 or more jobs, each appearing exactly once
+        :rtype:  :class:`list` of :class:`~.job.Job` objects
+        """
+        return [Job.instantiate(i, self._api)
+                for i in self._walk_dependencies_raw(field)]
+
+    def _walk_dependencies_raw(self, field):
+        """Walks the dependency graph for this job, returning the raw REST API
+        data for each job found
+
+        Each job in the dependency graph is only queried once, even when it
+        can be reached by more than one path, so graphs with shared or
+        circular dependencies are handled efficiently. The graph is walked
+        one level at a time, with all jobs on the same level being queried
+        concurrently. The traversal itself works only on URLs and the raw
+        JSON data, leaving the caller to construct job objects afterwards.
+
+        :param str field:
+            name of the REST API field that lists the direct dependencies of a
+            job. Either 'upstreamProjects' or 'downstreamProjects'.
+        :returns:
+            list of dictionaries containing the name, url and _class of each
+            job found, each job appearing exactly once
+        :rtype: :class:`list` of :class:`dict`
+        """
+        query = "tree={0}[name,url]".format(field)
+
+        retval = list()
+        visited = set([self._api.url])
+        pending = [self._api.url]
+        while pending:
+            responses = parallel_map(
+                lambda cur_url: self._api.get_api_data(
+                    target_url=cur_url, query_params=query),
+                pending)
+
+            pending = list()
+            for data in responses:
+                # Only some job types support dependencies, so the field may
+                # be omitted for some of the jobs we encounter
+                for cur_job in data.get(field, []):
+                    if cur_job['url'] in visited:
+                        continue
+                    visited.add(cur_job['url'])
+                    retval.append(cur_job)
+                    pending.append(cur_job['url'])
 
         return retval
 
@@ -11,13 +11,11 @@ class MultibranchPipelineJob(Job):
 
         :rtype: :class:`list` of :class:`~.pipelinejob.PipelineJob`
         """
-        data = self._api.get_api_data(query_params="depth=0")
+        # Branch jobs are created by Jenkins itself when it scans the
+        # repository, so this list is never served from the cache
+        data = self._api.get_api_data(query_params="tree=jobs[name,url]")
 
-        retval = list()
-        for j in data["jobs"]:
-            retval.append(Job.instantiate(j, self._api))
-
-        return retval
+        return [Job.instantiate(j, self._api) for j in data["jobs"]]
 
     # --------------------------------------------------------------- PLUGIN API
     @staticmethod
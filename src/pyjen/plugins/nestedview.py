@@ -1,6 +1,10 @@
 """Primitives for working with Jenkins views of type 'NestedView'"""
 from pyjen.view import View
-from pyjen.utils.helpers import create_view
+from pyjen.utils.helpers import create_view, parallel_map
+
+# REST API query used to load the names and URLs of the views nested under
+# a view, up to 3 levels deep, in a single request
+VIEW_TREE_QUERY = "tree=views[name,url,views[name,url,views[name,url]]]"
 
 
 class NestedView(View):
@@ -20,14 +24,10 @@ class NestedView(View):
         :returns: list of all views contained within this view
         :rtype: :class:`list` of :class:`pyjen.view.View`
         """
-        retval = list()
-
-        data = self._api.get_api_data()
-
-        for cur_view in data['views']:
-            retval.append(View.instantiate(cur_view, self._api))
+        data = self._api.get_api_data(
+            query_params="tree=views[name,url]", cache=True)
 
-        return retval
+        return [View.instantiate(i, self._api) for i in data['views']]
 
     def find_view(self, view_name):
         """Attempts to locate a sub-view under this nested view by name
@@ -43,12 +43,11 @@ class NestedView(View):
         :returns: List of 0 or more views with the given name
         :rtype: :class:`list` of :class:`pyjen.view.View`
         """
-        retval = list()
-        for cur_view in self.views:
-            if cur_view.name == view_name:
-                retval.append(cur_view)
+        data = self._api.get_api_data(
+            query_params="tree=views[name,url]", cache=True)
 
-        return retval
+        return [View.instantiate(i, self._api)
+                for i in data['views'] if i['name'] == view_name]
 
     @property
     def all_views(self):
@@ -59,15 +58,71 @@ class NestedView(View):
             recursively
         :rtype: :class:`list` of :class:`pyjen.view.View`
         """
+        return [View.instantiate(i, self._api) for i in self._walk_views_raw()]
+
+    def _walk_views_raw(self):
+        """Loads the REST API data describing all views nested under this one
+
+        Several levels of the view tree are loaded with each request, and
+        any sub-trees that extend beyond that are loaded concurrently. Views
+        that appear more than once in the tree are only reported once.
+
+        :returns:
+            REST API data, including the name and URL, of all views contained
+            within this view and it's children, recursively, in the same
+            order they would be found by walking the tree depth first
+        :rtype: :class:`list` of :class:`dict`
+        """
+        plugin_name = self.get_jenkins_plugin_name()
+
+        # Maps the URL of each nested view loaded with a separate request to
+        # the data describing the views it contains
+        sub_trees = dict()
+        urls = [self._api.url]
+        while urls:
+            responses = parallel_map(
+                lambda cur_url: self._api.get_api_data(
+                    target_url=cur_url, query_params=VIEW_TREE_QUERY),
+                urls)
+
+            pending = list()
+            for cur_url, cur_data in zip(urls, responses):
+                sub_trees[cur_url] = cur_data['views']
+                pending.extend(cur_data['views'])
+
+            # Nested views on the lowest level included in the response
+            # have had their children omitted, so they need to be loaded
+            # with a separate request
+            urls = list()
+            while pending:
+                cur_view = pending.pop()
+                if cur_view['_class'] != plugin_name:
+                    continue
+                if 'views' in cur_view:
+                    pending.extend(cur_view['views'])
+                elif cur_view['url'] not in sub_trees and \
+                        cur_view['url'] not in urls:
+                    urls.append(cur_view['url'])
+
+        # Tracks the URLs of all views encountered so far, so each view is
+        # reported, and its sub-tree walked, only once
         retval = list()
-        for cur_view in self.views:
+        visited = set([self._api.url])
+        pending = list(reversed(sub_trees[self._api.url]))
+        while pending:
+            cur_view = pending.pop()
+            if cur_view['url'] in visited:
+                continue
+            visited.add(cur_view['url'])
 
             retval.append(cur_view)
-
-            # See if our current view is, itself a nested view. If so then
-            # recurse into it appending all the views contained therein as well
-            if isinstance(cur_view, NestedView):
-                retval.extend(cur_view.all_views)
+            if cur_view['_class'] != plugin_name:
+                continue
+            if 'views' in cur_view:
+                children = cur_view['views']
+            else:
+                children = sub_trees.get(cur_view['url'], list())
+            pending.extend(reversed(children))
 
         return retval
 
@@ -86,12 +141,10 @@ class NestedView(View):
         :returns: List of 0 or more views with the given name
         :rtype: :class:`list` of :class:`pyjen.view.View`
         """
-        retval = list()
-        for cur_view in self.all_views:
-            if cur_view.name == view_name:
-                retval.append(cur_view)
-
-        return retval
+        # Only create view objects for those views that match the name we're
+        # looking for
+        return [View.instantiate(i, self._api) for i in self._walk_views_raw()
+                if i['name'] == view_name]
 
     def create_view(self, view_name, view_class):
         """Creates a new sub-view within this nested view
@@ -102,20 +155,7 @@ class NestedView(View):
         :returns: reference to the newly created view
         :rtype: :class:`pyjen.view.View`
         """
-        create_view(self._api, view_name, view_class)
-        result = self.find_view(view_name)
-
-        # Sanity Check: views within the same parent MUST have unique names.
-        # This is a hard requirement enforced by the Jenkins API. If, on the
-        # other hand, our search operation yielded no results then something
-        # very strange has happened (ie: a backend server problem). If the
-        # post operation fails for some reason an exception will be raised and
-        # this line of code should never get executed. So we do one quick
-        # sanity check to make sure we have 1, and exactly 1, result from
-        # our search operation.
-        assert len(result) == 1
-
-        return result[0]
+        return create_view(self._api, view_name, view_class)
 
     # --------------------------------------------------------------- PLUGIN API
     @staticmethod
@@ -1,5 +1,5 @@
 """String build parameter - plugin for parameterized build plugin"""
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -1,5 +1,5 @@
 """Jenkins post-build publisher of type Parameterized Build Trigger"""
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.utils.xml_plugin import XMLPlugin
 from pyjen.utils.plugin_api import instantiate_xml_plugin
 
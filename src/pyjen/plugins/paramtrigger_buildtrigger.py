@@ -1,7 +1,8 @@
 """Trigger configuration for a parameterized build trigger"""
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.utils.xml_plugin import XMLPlugin
 from pyjen.utils.plugin_api import instantiate_xml_plugin
+from pyjen.utils.helpers import split_names
 
 
 class BuildTriggerConfig(XMLPlugin):
@@ -27,8 +28,7 @@ class BuildTriggerConfig(XMLPlugin):
         :rtype: :class:`list` of :class:`str`
         """
         node = self.node.find("projects")
-        retval = node.text.split(",")
-        return [i.strip() for i in retval]
+        return split_names(node.text)
 
     @property
     def build_params(self):
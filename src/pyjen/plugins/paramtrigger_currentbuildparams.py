@@ -1,5 +1,5 @@
 """Trigger parameter for the Parameterized Trigger plugin"""
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
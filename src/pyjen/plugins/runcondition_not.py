@@ -1,7 +1,7 @@
 """Condition for the run condition plugin that inverts the logical result of
 another build condition.
 """
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
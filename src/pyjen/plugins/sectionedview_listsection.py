@@ -1,7 +1,7 @@
 """Primitives for controlling list view sub-sections on a sectioned view
 
 This is a plugin supported by the SectionedView plugin"""
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -1,5 +1,5 @@
 """Interface to control a basic shell build step job builder plugin"""
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
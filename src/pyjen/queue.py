@@ -30,11 +30,9 @@ class Queue(object):
 
         :rtype: :class:`list` of :class:`QueueItem`
         """
-        retval = list()
-        for cur_item in self._data["items"]:
-            queue_api = self._api.clone(self._api.root_url + cur_item["url"])
-            retval.append(QueueItem(queue_api))
-        return retval
+        root_url = self._api.root_url
+        return [QueueItem(self._api.clone(root_url + i["url"]))
+                for i in self._data["items"]]
 
 
 if __name__ == "__main__":  # pragma: no cover
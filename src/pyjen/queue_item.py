@@ -162,7 +162,12 @@ class QueueItem(object):
         if plugin is None:
             raise NotImplementedError(
                 "Job plugin not supported: " + job_data["_class"])
-        return plugin(self._api.clone(job_data["url"]))
+        # The task summary includes the name of the job, which we pre-load to
+        # avoid another hit to the REST API when it is queried
+        preloaded_data = None
+        if "name" in job_data:
+            preloaded_data = {"name": job_data["name"]}
+        return plugin(self._api.clone(job_data["url"], preloaded_data))
 
     @property
     def build(self):
@@ -176,7 +181,7 @@ class QueueItem(object):
         exe_info = self._data.get("executable")
         if exe_info is None:
             return None
-        return Build(self._api.clone(exe_info["url"]))
+        return Build.instantiate(exe_info, self._api)
 
     def cancel(self):
         """Cancels this queued build"""
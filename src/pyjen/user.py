@@ -22,7 +22,7 @@ class User(object):
 
         :rtype: :class:`str`
         """
-        data = self._api.get_api_data()
+        data = self._api.get_api_data(query_params="tree=id")
         return data['id']
 
     @property
@@ -1,5 +1,42 @@
 """Misc helper methods shared across the library"""
 import json
+import re
+from multiprocessing.pool import ThreadPool
+from six.moves import urllib_parse
+
+# Default number of worker threads used to issue concurrent requests to the
+# Jenkins REST API
+DEFAULT_MAX_WORKERS = 8
+
+# HTTP headers used when posting form data to the Jenkins REST API
+FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+# HTTP headers used when posting XML configuration data to the REST API
+XML_HEADERS = {'Content-Type': 'text/xml'}
+
+# Separator used between the names in comma delimited lists of jobs, along
+# with any white space surrounding it
+_NAME_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+def quote_name(name):
+    """Encodes the name of a Jenkins item for use as part of its URL
+
+    :param str name: name of the job or view to encode
+    :returns: the name, with any URL special characters escaped
+    :rtype: :class:`str`
+    """
+    return urllib_parse.quote(name, safe="")
+
+
+def split_names(text):
+    """Splits a comma delimited list of names, as stored in config.xml files
+
+    :param str text: comma delimited list of 1 or more names
+    :returns: each name from the list, with surrounding white space removed
+    :rtype: :class:`list` of :class:`str`
+    """
+    return _NAME_SEPARATOR.split(text.strip())
 
 
 def create_view(api, view_name, view_class):
@@ -13,9 +50,10 @@ def create_view(api, view_name, view_class):
         managed by the Jenkins instance
     :param view_class:
         PyJen plugin class associated with the type of view to be created
+    :returns: An object to manage the newly created view
+    :rtype: :class:`~.view.View`
     """
     view_type = view_class.get_jenkins_plugin_name()
-    headers = {'Content-Type': 'application/x-www-form-urlencoded'}
     data = {
         "name": view_name,
         "mode": view_type,
@@ -25,11 +63,16 @@ def create_view(api, view_name, view_class):
 
     args = {
         'data': data,
-        'headers': headers
+        'headers': FORM_HEADERS
     }
 
     api.post(api.url + 'createView', args)
 
+    # If the post operation succeeds we know exactly where Jenkins put the
+    # new view so there's no need to search for it
+    return view_class(api.clone(api.url + "view/" + quote_name(view_name),
+                                {"name": view_name}))
+
 
 def create_job(api, job_name, job_class):
     """Creates a new job on the Jenkins dashboard
@@ -42,20 +85,52 @@ def create_job(api, job_name, job_class):
         managed by the Jenkins instance
     :param job_class:
         PyJen plugin class associated with the type of job to be created
+    :returns: An object to manage the newly created job
+    :rtype: :class:`~.job.Job`
     """
-    headers = {'Content-Type': 'text/xml'}
-
     params = {
         "name": job_name
     }
 
-    xml_config = job_class.template_config_xml()
-    data = xml_config
-
     args = {
-        'data': data,
+        'data': job_class.template_config_xml(),
         'params': params,
-        'headers': headers
+        'headers': XML_HEADERS
     }
 
     api.post(api.url + 'createItem', args)
+
+    # If the post operation succeeds we know exactly where Jenkins put the
+    # new job so there's no need to search for it
+    return job_class(api.clone(api.url + "job/" + quote_name(job_name),
+                               {"name": job_name}))
+
+
+def parallel_map(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """Applies a function to each of a series of items, concurrently
+
+    Intended for fanning out independent requests to the Jenkins REST API, so
+    the total time taken is bounded by the slowest request rather than the sum
+    of all of them. If any call raises an exception it is re-raised here.
+
+    :param func:
+        callable accepting a single parameter, to apply to each item
+    :param items:
+        sequence of items to process
+    :param int max_workers:
+        maximum number of threads to run concurrently
+    :returns:
+        results of each call to the function, in the same order as the items
+        they were generated from
+    :rtype: :class:`list`
+    """
+    items = list(items)
+    if len(items) < 2 or max_workers < 2:
+        return [func(cur_item) for cur_item in items]
+
+    pool = ThreadPool(min(max_workers, len(items)))
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
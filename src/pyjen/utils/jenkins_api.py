@@ -1,10 +1,161 @@
 """Base class for all objects that interact with the Jenkins REST API"""
+import copy
 import logging
 import json
-import xml.etree.ElementTree as ElementTree
+import threading
+import time
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import InvalidHeader
-from six.moves import urllib_parse
+from pyjen.utils.xml_compat import ElementTree
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Maximum number of HTTP connections to the Jenkins server to keep open for
+# reuse by each connection pool
+CONNECTION_POOL_SIZE = 32
+
+# Number of seconds cached REST API responses remain valid
+CACHE_TTL = 5
+
+# Maximum number of REST API responses to remember validators for, per
+# connection. The least recently used entries are discarded first.
+VALIDATOR_CACHE_SIZE = 128
+
+
+def parse_json(content):
+    """Parses JSON encoded data returned from the Jenkins REST API
+
+    Uses the orjson library if it is installed, which is significantly faster
+    than the JSON parser from the standard library at decoding the large
+    documents generated by some REST API queries.
+
+    :param bytes content: UTF-8 encoded JSON data to parse
+    :returns: the decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(content)  # pylint: disable=no-member
+    return json.loads(content.decode("utf-8"))
+
+
+def _get_conditional_headers(response_headers):
+    """Generates the HTTP headers for a conditional request, based on the
+    validators provided in a previous response
+
+    :param response_headers: HTTP headers from the previous response
+    :returns:
+        headers to send with subsequent requests for the same resource, so
+        the server can skip sending the response if nothing has changed.
+        Will be empty if the response contained no validators.
+    :rtype: :class:`dict`
+    """
+    retval = dict()
+    etag = response_headers.get("ETag")
+    if etag:
+        retval["If-None-Match"] = etag
+    last_modified = response_headers.get("Last-Modified")
+    if last_modified:
+        retval["If-Modified-Since"] = last_modified
+    return retval
+
+
+class _ConnectionState(object):
+    """State associated with a connection to a Jenkins instance
+
+    A single instance of this class is shared by a
+    :class:`~.utils.jenkins_api.JenkinsAPI` object and all of its clones, so
+    connections and any data that is the same for every endpoint on the
+    Jenkins instance are reused across all of them.
+
+    :param tuple creds:
+        username and password pair to authenticate with when accessing
+        the REST API
+    :param ssl_cert:
+        Either a boolean controlling SSL verification, or a path to a cert
+        authority bundle to use for SSL verification.
+    """
+
+    def __init__(self, creds, ssl_cert):
+        self._creds = creds
+        self._ssl_cert = ssl_cert
+
+        # HTTP session used to communicate with the Jenkins server. Created
+        # on first use.
+        self._session = None
+
+        # Recently loaded REST API responses. Maps the URL of each query to a
+        # 2-tuple containing the time the data was loaded and the data itself.
+        self.cache = dict()
+
+        # Validators, like ETags, provided by the server for responses loaded
+        # from the REST API. Maps the URL of each query to a 2-tuple containing
+        # the HTTP headers used to make a conditional request for the same
+        # data, and the raw body of the response. Entries are ordered from
+        # least to most recently used, and access is guarded by a lock as the
+        # connection may be used by several threads at once.
+        self.validators = OrderedDict()
+        self.validators_lock = threading.Lock()
+
+        # Metadata describing the Jenkins instance, like the dashboard headers
+        # and the CSRF crumb, loaded at most once per connection
+        self.info = dict()
+
+    def get_validator(self, url):
+        """Gets the validator stored for the last response from a given URL
+
+        :param str url: URL of the REST API query
+        :returns:
+            2-tuple containing the headers for a conditional request for the
+            URL, and the raw body of the last response, or None if there is
+            no validator for the URL
+        :rtype: :class:`tuple`
+        """
+        with self.validators_lock:
+            retval = self.validators.pop(url, None)
+            if retval is not None:
+                self.validators[url] = retval
+            return retval
+
+    def set_validator(self, url, headers, content):
+        """Stores the validator provided by the server for a response
+
+        :param str url: URL of the REST API query
+        :param dict headers:
+            HTTP headers used to make a conditional request for the URL
+        :param bytes content: raw body of the response
+        """
+        with self.validators_lock:
+            self.validators.pop(url, None)
+            self.validators[url] = (headers, content)
+            while len(self.validators) > VALIDATOR_CACHE_SIZE:
+                self.validators.popitem(last=False)
+
+    def clear(self):
+        """Discards all cached REST API responses and validators"""
+        self.cache.clear()
+        with self.validators_lock:
+            self.validators.clear()
+
+    @property
+    def session(self):
+        """HTTP session used for all communication with the REST API
+
+        :rtype: :class:`requests.Session`
+        """
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.auth = self._creds
+            self._session.verify = self._ssl_cert
+            adapter = HTTPAdapter(
+                pool_connections=CONNECTION_POOL_SIZE,
+                pool_maxsize=CONNECTION_POOL_SIZE)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        return self._session
 
 
 class JenkinsAPI(object):
@@ -24,15 +175,16 @@ class JenkinsAPI(object):
         self._log = logging.getLogger(__name__)
 
         self._url = url.rstrip("/\\") + "/"
-        self._creds = creds
-        self._ssl_cert = ssl_cert
-
         self._jenkins_root_url = self._url
 
-        # Internal data members used for caching certain API response data
-        # to improve performance
-        self._crumb_cache = None
-        self._jenkins_headers_cache = None
+        # HTTP session, response caches and Jenkins metadata shared by this
+        # object and all of its clones
+        self._state = _ConnectionState(creds, ssl_cert)
+
+        # Subset of the API data for this endpoint that was already loaded by
+        # some parent object, such as the name of a job included in the job
+        # list for a view. Used to avoid redundant queries to the REST API
+        self._preloaded_data = None
 
     def __str__(self):
         """String representation of the job"""
@@ -42,19 +194,44 @@ class JenkinsAPI(object):
         """Encoded state of the job usable for serialization"""
         return "({0}: {1})".format(type(self), self.url)
 
-    def clone(self, api_url):
+    def clone(self, api_url, preloaded_data=None):
         """Creates a copy of this instance, for a new endpoint URL
 
         :param str api_url:
             URL for the new REST API endpoint to be managed
+        :param dict preloaded_data:
+            optional set of API data for the new endpoint that has already been
+            loaded from the REST API. Queries for these attributes will be
+            resolved locally instead of hitting the REST API. Should only
+            contain attributes that don't change over the lifetime of the
+            endpoint, like names.
         :returns:
             newly created JenkinsAPI
         :rtype: :class:`~.utils.jenkins_api.JenkinsAPI`
         """
-        retval = JenkinsAPI(api_url, self._creds, self._ssl_cert)
-        retval._jenkins_root_url = self._jenkins_root_url  # pylint: disable=protected-access
+        # Clones are created frequently when enumerating jobs and views, so
+        # rather than running the full constructor we make a shallow copy
+        # of our state. This shares the connection state, including the
+        # session and response caches, with the new instance.
+        retval = copy.copy(self)
+        retval._url = api_url.rstrip("/\\") + "/"  # pylint: disable=protected-access
+        retval._preloaded_data = preloaded_data  # pylint: disable=protected-access
         return retval
 
+    @property
+    def session(self):
+        """HTTP session used for all communication with the REST API
+
+        The session maintains a pool of persistent connections to the Jenkins
+        server, avoiding the need to establish a new connection for every
+        request made to the REST API. The credentials and SSL settings for the
+        connection are bound to the session so they apply to every request
+        made through it.
+
+        :rtype: :class:`requests.Session`
+        """
+        return self._state.session
+
     @property
     def url(self):
         """Gets the URL for the REST API endpoint managed by this object
@@ -85,17 +262,21 @@ class JenkinsAPI(object):
         UI theme, and others.
 
         :rtype: :class:`dict`"""
-        if self._jenkins_headers_cache is None:
-            temp_path = urllib_parse.urljoin(self.root_url, "api/python")
-            req = requests.get(
-                temp_path,
-                auth=self._creds,
-                verify=self._ssl_cert)
+        if "headers" not in self._state.info:
+            temp_path = self.root_url + "api/python"
+
+            # We only need the headers, so we try to avoid having the server
+            # generate the response body. Some servers and proxies don't
+            # support HEAD requests however, so we fall back to a GET if it
+            # fails.
+            req = self.session.head(temp_path)
+            if not req.ok:
+                req = self.session.get(temp_path)
             req.raise_for_status()
 
-            self._jenkins_headers_cache = req.headers
+            self._state.info["headers"] = req.headers
 
-        return self._jenkins_headers_cache
+        return self._state.info["headers"]
 
     @property
     def jenkins_version(self):
@@ -112,7 +293,7 @@ class JenkinsAPI(object):
             int(i) for i in self.jenkins_headers['x-jenkins'].split(".")
         ])
 
-    def get_api_data(self, target_url=None, query_params=None):
+    def get_api_data(self, target_url=None, query_params=None, cache=False):
         """retrieves the Jenkins API specific data from the specified URL
 
         :param str target_url:
@@ -120,29 +301,99 @@ class JenkinsAPI(object):
             data will be loaded from the default 'url' for this object
         :param str query_params:
             optional set of query parameters to customize the returned data
+        :param bool cache:
+            True to allow the response to be served from a short lived cache
+            of responses recently loaded from the same Jenkins instance. Only
+            suitable for data that rarely changes, like the names and URLs of
+            the jobs and views on the dashboard. The cache is discarded
+            whenever data is posted to the REST API. Cached responses are
+            shared by every object connected to the same Jenkins instance,
+            so callers must not modify the data returned by a cached query.
         :returns:
             The set of Jenkins attributes, converted to Python objects,
             associated with the given URL.
         :rtype: :class:`dict`
         """
         if target_url is None:
-            target_url = self.url
-
-        temp_url = urllib_parse.urljoin(target_url, "api/json")
+            retval = self._get_preloaded_data(query_params)
+            if retval is not None:
+                return retval
+            temp_url = self.url + "api/json"
+        else:
+            temp_url = target_url.rstrip("/") + "/api/json"
 
         if query_params is not None:
             # TODO: Update this to pass 'params' key to get method
             temp_url += "?" + query_params
 
-        req = requests.get(
-            temp_url,
-            auth=self._creds,
-            verify=self._ssl_cert)
-        req.raise_for_status()
-        retval = req.json()
-        self._log.debug(json.dumps(retval, indent=4))
+        if cache and temp_url in self._state.cache:
+            timestamp, retval = self._state.cache[temp_url]
+            if time.time() - timestamp < CACHE_TTL:
+                return retval
+
+        # If the server gave us a validator for the last response from this
+        # URL we make the request conditional, so the body only gets sent
+        # again if the data has changed. The raw body of the response is kept
+        # rather than the decoded data, so uncached queries always return a
+        # new copy of the data which the caller is free to modify.
+        validator = self._state.get_validator(temp_url)
+        headers = validator[0] if validator is not None else None
+
+        req = self.session.get(temp_url, headers=headers)
+        if validator is not None and req.status_code == 304:
+            content = validator[1]
+        else:
+            req.raise_for_status()
+            content = req.content
+
+            conditional_headers = _get_conditional_headers(req.headers)
+            if conditional_headers:
+                self._state.set_validator(
+                    temp_url, conditional_headers, content)
+
+        retval = parse_json(content)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(json.dumps(retval, indent=4))
+
+        if cache:
+            self._state.cache[temp_url] = (time.time(), retval)
         return retval
 
+    def invalidate(self):
+        """Discards all cached REST API responses
+
+        The cache, including any validators used to make conditional
+        requests, is shared by all objects connected to the same Jenkins
+        instance. It is discarded automatically whenever data is posted
+        through any of them, but callers may need to discard it explicitly to
+        see changes made to the Jenkins instance by other clients.
+        """
+        self._state.clear()
+
+    def _get_preloaded_data(self, query_params):
+        """Attempts to resolve an API query using pre-loaded API data
+
+        Only simple queries of the form "tree=field1,field2" can be resolved
+        this way, and only when all of the requested fields were pre-loaded.
+
+        :param str query_params: query parameters for the API request
+        :returns:
+            the requested subset of the pre-loaded data, or None if the query
+            can not be resolved without hitting the REST API
+        :rtype: :class:`dict`
+        """
+        if not self._preloaded_data or not query_params:
+            return None
+        if not query_params.startswith("tree=") or "[" in query_params or \
+                "&" in query_params:
+            return None
+
+        fields = query_params[len("tree="):].split(",")
+        for cur_field in fields:
+            if cur_field not in self._preloaded_data:
+                return None
+        return dict((i, self._preloaded_data[i]) for i in fields)
+
     def get_text(self, path=None, params=None):
         """ gets the raw text data from a Jenkins URL
 
@@ -156,16 +407,57 @@ class JenkinsAPI(object):
         """
         temp_url = self.url
         if path is not None:
-            temp_url = urllib_parse.urljoin(temp_url, path.lstrip("/\\"))
+            temp_url += path.lstrip("/\\")
+
+        return self._get(temp_url, params).text
 
-        req = requests.get(
-            temp_url,
-            auth=self._creds,
-            verify=self._ssl_cert,
-            params=params)
+    def get_raw(self, path=None, params=None):
+        """Gets a file-like object that streams the raw data from a Jenkins URL
+
+        Unlike :meth:`get_text`, the response is not loaded into memory all at
+        once, so large documents can be processed incrementally as they are
+        downloaded. The caller is responsible for closing the returned object
+        once it is no longer needed.
+
+        :param str path:
+            optional extension path to append to the root URL managed by this
+            object when performing the get operation
+        :param dict params:
+            optional query parameters to be passed to the request
+        :returns: file-like object providing the raw, undecoded response data
+        """
+        temp_url = self.url
+        if path is not None:
+            temp_url += path.lstrip("/\\")
+
+        req = self.session.get(temp_url, params=params, stream=True)
         req.raise_for_status()
 
-        return req.text
+        # Make sure any transport compression is undone as the data is read
+        req.raw.decode_content = True
+        return req.raw
+
+    def get_progressive_text(self, start=0):
+        """Gets the log text produced by the Jenkins object since some point
+
+        Uses the progressive text API provided by Jenkins for objects which
+        produce log output incrementally, like builds, so callers can follow
+        the log without downloading all of it each time.
+
+        :param int start:
+            number of characters at the start of the log to skip
+        :returns:
+            3-tuple containing the new log text, the offset to use to get the
+            text produced after it, and a boolean indicating whether more
+            text may still be produced
+        :rtype: :class:`tuple`
+        """
+        req = self._get(self.url + "logText/progressiveText",
+                        params={"start": start})
+
+        next_start = int(req.headers.get("X-Text-Size", start))
+        more_data = req.headers.get("X-More-Data") == "true"
+        return req.text, next_start, more_data
 
     def get_api_xml(self, path=None, params=None):
         """Gets api XML data from a given REST API endpoint
@@ -179,11 +471,24 @@ class JenkinsAPI(object):
         """
         temp_url = self.url
         if path is not None:
-            temp_url = urllib_parse.urljoin(temp_url, path.lstrip("/\\"))
-        temp_url += "/api/xml"
-        text = self.get_text(temp_url, params)
+            temp_url += path.strip("/\\") + "/"
+        temp_url += "api/xml"
+        text = self._get(temp_url, params).text
         return ElementTree.fromstring(text)
 
+    def _get(self, target_url, params=None):
+        """Performs a get operation on a Jenkins URL
+
+        :param str target_url: Full URL to query
+        :param dict params:
+            optional query parameters to be passed to the request
+        :returns: reference to the response data returned by the request
+        :rtype: :class:`requests.models.Response`
+        """
+        req = self.session.get(target_url, params=params)
+        req.raise_for_status()
+        return req
+
     def post(self, target_url, args=None):
         """sends data to or triggers an operation via a Jenkins URL
 
@@ -202,21 +507,22 @@ class JenkinsAPI(object):
         :returns: reference to the response data returned by the post request
         :rtype: :class:`requests.models.Response`
         """
-        if args and "headers" in args:
-            temp_headers = args["headers"]
-            del args["headers"]
-        else:
-            temp_headers = dict()
+        # NOTE: we copy the given arguments rather than modifying them so
+        #       callers are free to reuse them across multiple requests
+        args = dict(args) if args else dict()
+        temp_headers = dict(args.pop("headers", dict()))
 
         if self.jenkins_version >= (2, 0, 0) and self.crumb:
             temp_headers.update(self.crumb)
 
-        req = requests.post(
+        req = self.session.post(
             target_url,
-            auth=self._creds,
-            verify=self._ssl_cert,
             headers=temp_headers,
-            **args if args else dict())
+            **args)
+
+        # Any post operation may modify the state of the Jenkins instance, so
+        # we need to discard any cached data it may have invalidated
+        self.invalidate()
 
         req.raise_for_status()
         return req
@@ -237,29 +543,26 @@ class JenkinsAPI(object):
 
         :rtype: :class:`dict`
         """
-        if self._crumb_cache is None:
+        if "crumb" not in self._state.info:
             # Query the REST API for the crumb token
-            req = requests.get(
-                self.root_url + 'crumbIssuer/api/json',
-                auth=self._creds,
-                verify=self._ssl_cert)
+            req = self.session.get(self.root_url + 'crumbIssuer/api/json')
 
             if req.status_code == 404:
                 # If we get a 404 error, endpoint not found, assume the Cross
                 # Site Scripting support has been disabled
-                self._crumb_cache = ''
+                self._state.info["crumb"] = ''
             else:
                 req.raise_for_status()
-                data = req.json()
+                data = parse_json(req.content)
 
                 # Seeing as how the crumb for a given Jenkins instance is
                 # static, we cache the results locally to prevent having to hit
                 # the API unnecessarily
-                self._crumb_cache = {
+                self._state.info["crumb"] = {
                     data['crumbRequestField']: data['crumb']
                 }
 
-        return self._crumb_cache
+        return self._state.info["crumb"]
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,6 +1,7 @@
 """Abstractions for managing the raw config.xml for a Jenkins job"""
 import logging
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
+from pyjen.utils.helpers import XML_HEADERS
 from pyjen.utils.plugin_api import find_plugin
 
 
@@ -28,13 +29,19 @@ class JobXML(object):
         """Gets the decoded root node from the config xml"""
         if self._cache is not None:
             return self._cache
-        text = self._api.get_text("/config.xml")
-        self._cache = ElementTree.fromstring(text)
+        # Parse the XML as it is downloaded rather than loading the whole
+        # document into memory first. This also lets the parser honor the
+        # encoding declared in the document.
+        stream = self._api.get_raw("/config.xml")
+        try:
+            self._cache = ElementTree.parse(stream).getroot()
+        finally:
+            stream.close()
         return self._cache
 
     def update(self):
         """Posts all changes made to the object back to Jenkins"""
-        args = {'data': self.xml, 'headers': {'Content-Type': 'text/xml'}}
+        args = {'data': self.xml, 'headers': XML_HEADERS}
         self._api.post(self._api.url + "config.xml", args)
 
     @property
@@ -47,8 +54,18 @@ class JobXML(object):
 
     @xml.setter
     def xml(self, value):
-        self._cache = ElementTree.fromstring(value)
-        self.update()
+        """Updates the job config from some new, statically defined XML source
+
+        :param str value:
+            raw XML config data to be uploaded
+        """
+        # Parse the XML before uploading it so malformed XML is rejected
+        # locally, but upload the XML text as given rather than re-serializing
+        # the parsed version of it
+        new_root = ElementTree.fromstring(value)
+        args = {'data': value, 'headers': XML_HEADERS}
+        self._api.post(self._api.url + "config.xml", args)
+        self._cache = new_root
 
     @property
     def plugin_name(self):
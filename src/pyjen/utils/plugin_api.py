@@ -12,6 +12,13 @@ PLUGIN_ENTRYPOINT_NAME = "pyjen.plugins.v1.0"
 PLUGIN_METHOD_NAME = "get_jenkins_plugin_name"
 
 
+# Plugins discovered so far, loaded on first use. Looking up the installed
+# entry points is expensive, so it is only done once per process.
+#   all - list of all supported plugin classes
+#   index - maps Jenkins plugin names to the list of supporting classes
+_PLUGIN_CACHE = dict()
+
+
 def find_plugin(plugin_name):
     """Locates the PyJen class associated with a given Jenkins plugin
 
@@ -23,17 +30,19 @@ def find_plugin(plugin_name):
     """
     formatted_plugin_name = plugin_name.replace("__", "_")
 
-    log = logging.getLogger(__name__)
-
-    supported_plugins = list()
-    for cur_plugin in get_all_plugins():
-        if getattr(cur_plugin, PLUGIN_METHOD_NAME)() == formatted_plugin_name:
-            supported_plugins.append(cur_plugin)
+    if "index" not in _PLUGIN_CACHE:
+        index = dict()
+        for cur_plugin in get_all_plugins():
+            name = getattr(cur_plugin, PLUGIN_METHOD_NAME)()
+            index.setdefault(name, list()).append(cur_plugin)
+        _PLUGIN_CACHE["index"] = index
 
+    supported_plugins = _PLUGIN_CACHE["index"].get(formatted_plugin_name)
     if not supported_plugins:
         return None
 
     if len(supported_plugins) > 1:
+        log = logging.getLogger(__name__)
         log.warning("multiple plugins detected for specified Jenkins"
                     " object: %s. Using first match.", formatted_plugin_name)
 
@@ -43,6 +52,30 @@ def find_plugin(plugin_name):
 def get_all_plugins():
     """Returns a list of all PyJen plugins installed on the system
 
+    The installed plugins are discovered the first time this is called, and
+    reused from then on. See :func:`clear_plugin_cache`.
+
+    :returns: list of 0 or more installed plugins
+    :rtype: :class:`list` of :class:`class`
+    """
+    if "all" not in _PLUGIN_CACHE:
+        _PLUGIN_CACHE["all"] = _load_plugins()
+    return list(_PLUGIN_CACHE["all"])
+
+
+def clear_plugin_cache():
+    """Discards the list of plugins discovered so far
+
+    The installed plugins will be discovered again the next time they are
+    needed. Only needed when plugins are installed or removed while PyJen is
+    running.
+    """
+    _PLUGIN_CACHE.clear()
+
+
+def _load_plugins():
+    """Discovers all PyJen plugins installed on the system
+
     :returns: list of 0 or more installed plugins
     :rtype: :class:`list` of :class:`class`
     """
@@ -1,6 +1,7 @@
 """Abstractions for managing the raw config.xml for a Jenkins view"""
 import logging
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
+from pyjen.utils.helpers import XML_HEADERS
 
 
 class ViewXML(object):
@@ -28,13 +29,19 @@ class ViewXML(object):
         """Gets the decoded root node from the config xml"""
         if self._cache is not None:
             return self._cache
-        text = self._api.get_text("/config.xml")
-        self._cache = ElementTree.fromstring(text)
+        # Parse the XML as it is downloaded rather than loading the whole
+        # document into memory first. This also lets the parser honor the
+        # encoding declared in the document.
+        stream = self._api.get_raw("/config.xml")
+        try:
+            self._cache = ElementTree.parse(stream).getroot()
+        finally:
+            stream.close()
         return self._cache
 
     def update(self):
         """Posts all changes made to the object back to Jenkins"""
-        args = {'data': self.xml, 'headers': {'Content-Type': 'text/xml'}}
+        args = {'data': self.xml, 'headers': XML_HEADERS}
         self._api.post(self._api.url + "config.xml", args)
 
     @property
@@ -52,7 +59,7 @@ class ViewXML(object):
         :param str new_xml:
             raw XML config data to be uploaded
         """
-        args = {'data': new_xml, 'headers': {'Content-Type': 'text/xml'}}
+        args = {'data': new_xml, 'headers': XML_HEADERS}
         self._api.post(self._api.url + "config.xml", args)
         self._cache = ElementTree.fromstring(new_xml)
 
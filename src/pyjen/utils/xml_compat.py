@@ -0,0 +1,20 @@
+"""Compatibility shim selecting the fastest available ElementTree module
+
+All XML parsing in PyJen goes through the module exposed here, so elements
+created by one part of the library can be safely attached to trees parsed by
+another. On Python 2 this is the C implementation from cElementTree, which is
+several times faster than the pure Python ElementTree module. On Python 3
+the standard ElementTree module uses the C implementation automatically.
+"""
+# pylint: disable=deprecated-module
+try:
+    from xml.etree import cElementTree as ElementTree
+except ImportError:  # pragma: no cover
+    from xml.etree import ElementTree
+# pylint: enable=deprecated-module
+
+__all__ = ["ElementTree"]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
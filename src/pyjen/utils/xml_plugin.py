@@ -1,6 +1,6 @@
 """Primitives common to all PyJen plugins that extend Jenkins config.xml"""
 import logging
-import xml.etree.ElementTree as ElementTree
+from pyjen.utils.xml_compat import ElementTree
 
 
 class XMLPlugin(object):
@@ -1,10 +1,24 @@
 """Primitives for interacting with Jenkins views"""
+import json
 import logging
+from requests.exceptions import HTTPError
 from six.moves import urllib_parse
 from pyjen.job import Job
 from pyjen.utils.viewxml import ViewXML
 from pyjen.utils.plugin_api import find_plugin, get_all_plugins
-from pyjen.utils.helpers import create_view
+from pyjen.utils.helpers import create_view, quote_name, parallel_map, \
+    DEFAULT_MAX_WORKERS, FORM_HEADERS
+
+# Marker printed by the bulk delete script once all jobs have been deleted
+BULK_DELETE_MARKER = "pyjen-bulk-delete-complete"
+
+# Groovy script run on the Jenkins master to delete a list of jobs, given
+# their full names, in a single request
+BULK_DELETE_SCRIPT = \
+    "{0}.each {{ name ->\n" \
+    "    jenkins.model.Jenkins.instance.getItemByFullName(name)?.delete()\n" \
+    "}}\n" \
+    "println '" + BULK_DELETE_MARKER + "'\n"
 
 
 class View(object):
@@ -50,7 +64,15 @@ class View(object):
         :returns: the name of the view
         :rtype: :class:`str`
         """
-        data = self._api.get_api_data()
+        # The name of a view is encoded in the last part of its URL, so we
+        # only need to query the REST API for views that aren't accessed that
+        # way, like the default view on the dashboard
+        parts = urllib_parse.urlsplit(self._api.url).path.split("/")
+        parts = [cur_part for cur_part in parts if cur_part.strip()]
+        if len(parts) >= 2 and parts[-2] == "view":
+            return urllib_parse.unquote(parts[-1])
+
+        data = self._api.get_api_data(query_params="tree=name")
         return data['name']
 
     @property
@@ -65,34 +87,87 @@ class View(object):
         :returns: list of 0 or more jobs that are included in this view
         :rtype:  :class:`list` of :class:`~.job.Job` objects
         """
-        data = self._api.get_api_data(query_params="depth=0")
+        data = self._api.get_api_data(
+            query_params="tree=jobs[name,url]", cache=True)
 
-        view_jobs = data['jobs']
+        return [Job.instantiate(j, self._api) for j in data['jobs']]
 
-        retval = []
-        for j in view_jobs:
-            retval.append(Job.instantiate(j, self._api))
+    def refresh(self):
+        """Discards any REST API data cached for this view
 
-        return retval
+        Listings of jobs are cached for a few seconds to avoid redundant
+        queries, and the cache is discarded automatically whenever changes are
+        made through PyJen. This method only needs to be called to see changes
+        made to the Jenkins instance by other clients within that time frame.
+        """
+        self._api.invalidate()
 
     def delete(self):
         """Deletes this view from the dashboard"""
         self._api.post(self._api.url + "doDelete")
 
-    def delete_all_jobs(self):
-        """allows callers to do bulk deletes of all jobs found in this view"""
-        for j in self.jobs:
-            j.delete()
+    def delete_all_jobs(self, max_workers=DEFAULT_MAX_WORKERS, bulk=False):
+        """allows callers to do bulk deletes of all jobs found in this view
+
+        :param int max_workers:
+            maximum number of jobs to delete concurrently
+        :param bool bulk:
+            if True, all jobs are deleted in a single request by running a
+            Groovy script on the Jenkins master. This requires the
+            credentials used by PyJen to have permission to run scripts,
+            which is usually restricted to administrators. If the script
+            can't be run, the jobs are deleted one at a time as usual.
+        """
+        if bulk and self._bulk_delete_jobs():
+            return
+        parallel_map(lambda j: j.delete(), self.jobs, max_workers)
+
+    def _bulk_delete_jobs(self):
+        """Deletes all jobs in this view using a single Groovy script
+
+        :returns:
+            True if the jobs were deleted, False if the script could not be run
+        :rtype: :class:`bool`
+        """
+        data = self._api.get_api_data(query_params="tree=jobs[fullName]")
+        names = [i["fullName"] for i in data["jobs"]]
+        if not names:
+            return True
+
+        # JSON string literals are valid Groovy string literals, as long as
+        # we escape the $ characters Groovy would use for interpolation
+        script = BULK_DELETE_SCRIPT.format(
+            json.dumps(names).replace("$", "\\$"))
+        try:
+            req = self._api.post(
+                self._api.root_url + "scriptText",
+                {"data": {"script": script}, "headers": FORM_HEADERS})
+        except HTTPError as err:
+            self._log.debug("Unable to run bulk delete script: %s", err)
+            return False
 
-    def disable_all_jobs(self):
-        """allows caller to bulk-disable all jobs found in this view"""
-        for j in self.jobs:
-            j.disable()
+        # Errors in the script are reported in the output rather than through
+        # the status code of the response
+        if BULK_DELETE_MARKER not in req.text:
+            self._log.debug("Bulk delete script failed: %s", req.text)
+            return False
+        return True
 
-    def enable_all_jobs(self):
-        """allows caller to bulk-enable all jobs found in this view"""
-        for j in self.jobs:
-            j.enable()
+    def disable_all_jobs(self, max_workers=DEFAULT_MAX_WORKERS):
+        """allows caller to bulk-disable all jobs found in this view
+
+        :param int max_workers:
+            maximum number of jobs to disable concurrently
+        """
+        parallel_map(lambda j: j.disable(), self.jobs, max_workers)
+
+    def enable_all_jobs(self, max_workers=DEFAULT_MAX_WORKERS):
+        """allows caller to bulk-enable all jobs found in this view
+
+        :param int max_workers:
+            maximum number of jobs to enable concurrently
+        """
+        parallel_map(lambda j: j.enable(), self.jobs, max_workers)
 
     @property
     def view_metrics(self):
@@ -101,28 +176,27 @@ class View(object):
         :return: Dictionary containing metrics about the view
         :rtype: :class:`dict`
         """
-        data = self._api.get_api_data()
+        # The state of each job is determined by its color, so we load the
+        # colors of all jobs in a single query rather than querying each job
+        data = self._api.get_api_data(query_params="tree=jobs[name,url,color]")
 
         broken_jobs = []
         disabled_jobs = []
         unstable_jobs = []
-        broken_job_count = 0
-        disabled_jobs_count = 0
-        unstable_job_count = 0
+        jobs_by_color = {
+            "red": broken_jobs,
+            "disabled": disabled_jobs,
+            "yellow": unstable_jobs,
+        }
 
         for job in data["jobs"]:
+            target = jobs_by_color.get(job.get("color"))
+            if target is not None:
+                target.append(Job.instantiate(job, self._api))
 
-            temp_job = Job.instantiate(job, self._api)
-
-            if temp_job.is_failing:
-                broken_job_count += 1
-                broken_jobs.append(temp_job)
-            elif temp_job.is_disabled:
-                disabled_jobs_count += 1
-                disabled_jobs.append(temp_job)
-            elif temp_job.is_unstable:
-                unstable_job_count += 1
-                unstable_jobs.append(temp_job)
+        broken_job_count = len(broken_jobs)
+        disabled_jobs_count = len(disabled_jobs)
+        unstable_job_count = len(unstable_jobs)
 
         return {"broken_jobs_count": broken_job_count,
                 "disabled_jobs_count": disabled_jobs_count,
@@ -156,9 +230,8 @@ class View(object):
 
         # Update our REST API object to point to the endpoint associated
         # with the newly created view
-        new_url = urllib_parse.urljoin(
-            parent_api.url, "view/" + new_view_name)
-        updated_api = self._api.clone(new_url)
+        new_url = parent_api.url + "view/" + quote_name(new_view_name)
+        updated_api = self._api.clone(new_url, {"name": new_view_name})
 
         return updated_api, updated_xml
 
@@ -212,6 +285,13 @@ class View(object):
 
         :rtype: :class:`str`
         """
+        # Views managed by a PyJen plugin already know the name of the Jenkins
+        # plugin they are associated with, so we only need to load the config
+        # XML for views of unknown types. The root element of the XML is named
+        # after the class implementing the view, with underscores escaped.
+        get_plugin_name = getattr(self, "get_jenkins_plugin_name", None)
+        if get_plugin_name is not None:
+            return get_plugin_name().replace("_", "__")
         return self._view_xml.plugin_name
 
     @property
@@ -253,11 +333,6 @@ class View(object):
             PyJen view object wrapping the REST API for the given Jenkins view
         :rtype: :class:`~.view.View`
         """
-        # TODO: Find some way to cache the json data given inside the view so
-        #       we can lazy-load API data. For example, the name of the view
-        #       is always included in the json data and therefore queries for
-        #       the View name after creation should not require another hit
-        #       to the REST API
         log = logging.getLogger(__name__)
         # The default view will not have a valid view URL
         # so we need to look for this and generate a corrected one
@@ -288,7 +363,10 @@ class View(object):
             log.debug("Unable to find plugin for class %s", json_data["_class"])
             plugin_class = View
 
-        return plugin_class(rest_api.clone(view_url))
+        # The name of the view is always included in the json data so we
+        # pre-load it to avoid another hit to the REST API when it is queried
+        preloaded_data = {"name": json_data["name"]}
+        return plugin_class(rest_api.clone(view_url, preloaded_data))
 
     @classmethod
     def get_supported_plugins(cls):
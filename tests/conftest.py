@@ -1,4 +1,5 @@
 import os
+import re
 import shutil
 import tarfile
 import io
@@ -6,12 +7,14 @@ import json
 import pytest
 import logging
 import docker
-import multiprocessing
+import threading
 from docker.errors import DockerException
+from mock import patch
 from pyjen.jenkins import Jenkins
 from pyjen.plugins.freestylejob import FreestyleJob
 from pyjen.plugins.gitscm import GitSCM
-from .utils import async_assert
+from pyjen.utils.plugin_api import clear_plugin_cache
+from .utils import async_assert, clean_job, unique_name
 
 
 # Default Docker container to use for testing
@@ -70,11 +73,54 @@ def pytest_addoption(parser):
     )
 
 
+def pytest_configure(config):
+    """Registers the custom markers used by the test suite"""
+    config.addinivalue_line(
+        "markers",
+        "fail_fast: abort the test run when this test fails and the "
+        "PYJEN_FAIL_FAST environment variable is set to 1"
+    )
+
+
+class GeneratorStream(object):
+    """Read-only file-like wrapper around a generator of byte strings
+
+    Allows data to be consumed incrementally as it is produced, rather than
+    having to buffer all of it in memory first
+
+    :param chunks: iterable producing 0 or more byte strings
+    """
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read(self, size=-1):
+        """Reads up to a given number of bytes from the stream
+
+        :param int size:
+            maximum number of bytes to read. If negative, all remaining data
+            is read
+        :rtype: :class:`bytes`
+        """
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        if size < 0:
+            size = len(self._buffer)
+        retval = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return retval
+
+
 def extract_file(client, container, path):
     """Extracts a single file from a Docker container
 
     Extraction is performed in-memory to improve performance and minimize
-    disk dependency
+    disk dependency. The tar ball generated by Docker is parsed as it is
+    downloaded rather than being buffered in its entirety first.
 
     :param client: Docker API connection to the service
     :param int container: ID of the container to work with
@@ -89,17 +135,14 @@ def extract_file(client, container, path):
     byte_stream, stats = client.get_archive(container, path)
     log.debug(json.dumps(stats, indent=4))
 
-    # convert the in memory byte stream from a generator
-    # to a file-like container
-    in_memory_tar = io.BytesIO()
-    for packet in byte_stream:
-        in_memory_tar.write(packet)
-    in_memory_tar.seek(0)
-
-    # parse the in-memory tar data
-    with tarfile.open(fileobj=in_memory_tar) as tf:
-        cur_mem = tf.getmember(os.path.split(path)[1])
-        return tf.extractfile(cur_mem).read().decode("utf-8").strip()
+    # parse the tar data as a stream, scanning for the file we're
+    # interested in
+    file_name = os.path.split(path)[1]
+    with tarfile.open(fileobj=GeneratorStream(byte_stream), mode="r|") as tf:
+        for cur_mem in tf:
+            if cur_mem.name == file_name:
+                return tf.extractfile(cur_mem).read().decode("utf-8").strip()
+    raise KeyError("File {0} not found in container".format(path))
 
 
 def inject_file(client, container, local_file_path, container_path):
@@ -112,16 +155,11 @@ def inject_file(client, container, local_file_path, container_path):
     :param str container_path:
         path within the container to inject the file to
     """
-    if os.path.exists("temp.tar"):
-        os.unlink("temp.tar")
-
-    with tarfile.open("temp.tar", 'w') as tar:
+    in_memory_tar = io.BytesIO()
+    with tarfile.open(fileobj=in_memory_tar, mode="w") as tar:
         tar.add(local_file_path)
 
-    with open("temp.tar") as tf:
-        client.put_archive(container, container_path, tf)
-
-    os.unlink("temp.tar")
+    client.put_archive(container, container_path, in_memory_tar.getvalue())
 
 
 def _workspace_dir():
@@ -170,6 +208,39 @@ def configure_logger():
     global_log.addHandler(file_handler)
 
 
+@pytest.fixture
+def fresh_plugin_cache():
+    """Discards the cached list of installed PyJen plugins before and after
+    a test, for tests that fake the set of installed plugins"""
+    clear_plugin_cache()
+    yield
+    clear_plugin_cache()
+
+
+@pytest.fixture
+def mock_jenkins_api():
+    """Replaces the REST API object used by the Jenkins class with a mock
+
+    Yields the mocked REST API object that will be used by any Jenkins
+    objects created while the fixture is active.
+    """
+    with patch("pyjen.jenkins.JenkinsAPI") as api_class:
+        api_class.return_value.url = "https://0.0.0.0/"
+        yield api_class.return_value
+
+
+@pytest.fixture
+def mock_session():
+    """Replaces the HTTP session used to access the Jenkins REST API
+
+    Yields the mocked session, which is shared by all REST API objects
+    created while the fixture is active. Tests may customize the responses
+    returned by its get, head and post methods.
+    """
+    with patch("pyjen.utils.jenkins_api.requests") as req:
+        yield req.Session.return_value
+
+
 @pytest.fixture(scope="session")
 def jenkins_env(request, configure_logger):
     """Fixture that generates a dockerized Jenkins environment for testing"""
@@ -183,7 +254,13 @@ def jenkins_env(request, configure_logger):
     image_name = request.config.getoption("--jenkins-version")
     log.info("Using Jenkins docker container '{0}'".format(image_name))
     preserve_container = request.config.getoption("--preserve")
-    container_id_file = os.path.join(_workspace_dir(), "container_id.txt")
+    # Each pytest-xdist worker gets a container of its own
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id:
+        file_name = "container_id_{0}.txt".format(worker_id)
+    else:
+        file_name = "container_id.txt"
+    container_id_file = os.path.join(_workspace_dir(), file_name)
 
     try:
        client = docker.APIClient(version="auto")
@@ -254,7 +331,7 @@ def jenkins_env(request, configure_logger):
         log.debug("Container %s created", container_id)
 
     # Setup background thread for redirecting log output to Python logger
-    d = multiprocessing.Process(
+    d = threading.Thread(
         name='docker_logger',
         target=docker_logger,
         args=(client, container_id))
@@ -318,8 +395,33 @@ def jenkins_env(request, configure_logger):
             log.info("Done Docker cleanup")
 
 
+@pytest.fixture(scope="session")
+def jk(jenkins_env):
+    """Jenkins client connected to the dockerized test environment
+
+    The client is shared by all tests in the session so the connection
+    and authentication handshake only needs to be performed once
+    """
+    return Jenkins(
+        jenkins_env["url"],
+        (jenkins_env["admin_user"], jenkins_env["admin_token"]))
+
+
+@pytest.fixture
+def fresh_job(request, jk):
+    """Test fixture that creates an empty Jenkins Freestyle job for a test
+
+    The job is named after the test that uses it, and is automatically
+    deleted once the test completes.
+    """
+    job_name = re.sub(r"\W", "_", request.node.name)
+    jb = jk.create_job(unique_name(job_name), FreestyleJob)
+    with clean_job(jb):
+        yield jb
+
+
 @pytest.fixture(scope="class")
-def test_job(request, jenkins_env):
+def test_job(request, jk):
     """Test fixture that creates a Jenkins Freestyle job for testing purposes
 
     The generated job is automatically cleaned up at the end of the test
@@ -330,7 +432,6 @@ def test_job(request, jenkins_env):
     only perform read operations on the job and will not change it's state.
     This will ensure the tests within the suite don't affect one another.
     """
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
     request.cls.jenkins = jk
     request.cls.job = jk.create_job(request.cls.__name__ + "Job", FreestyleJob)
     assert request.cls.job is not None
@@ -372,3 +473,22 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "jenkins_env" in item.fixturenames:
             item.add_marker(skip_jenkins)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Stops the test run early when a test marked as fail_fast fails
+
+    Tests that depend on the Jenkins service tend to fail slowly, waiting
+    out their timeouts, when the service is broken. When the PYJEN_FAIL_FAST
+    environment variable is set to 1, the first failure in a test marked with
+    fail_fast aborts the remaining tests instead.
+    """
+    outcome = yield
+    if os.environ.get("PYJEN_FAIL_FAST") != "1":
+        return
+    if item.get_closest_marker("fail_fast") is None:
+        return
+    if outcome.get_result().failed:
+        item.session.shouldstop = \
+            "{0} failed. Skipping remaining tests.".format(item.nodeid)
@@ -1,7 +1,8 @@
 from datetime import datetime
 import pytest
-from .utils import clean_job, async_assert
-from pyjen.jenkins import Jenkins
+from .utils import clean_job, async_assert, async_assert_build, unique_name
+from pyjen.build import Build
+from pyjen.utils.jenkins_api import JenkinsAPI
 from pyjen.plugins.shellbuilder import ShellBuilder
 from pyjen.plugins.freestylejob import FreestyleJob
 
@@ -36,9 +37,8 @@ class TestSingleBuild:
         assert not bld1 != bld2
 
 
-def test_start_time(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
-    jb = jk.create_job("test_start_time_job", FreestyleJob)
+def test_start_time(jk):
+    jb = jk.create_job(unique_name("test_start_time_job"), FreestyleJob)
     with clean_job(jb):
         jb.quiet_period = 0
         before = datetime.now()
@@ -50,9 +50,8 @@ def test_start_time(jenkins_env):
         assert before <= bld.start_time <= after
 
 
-def test_build_inequality(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
-    jb = jk.create_job("test_build_inequality_job", FreestyleJob)
+def test_build_inequality(jk):
+    jb = jk.create_job(unique_name("test_build_inequality_job"), FreestyleJob)
     with clean_job(jb):
         jb.quiet_period = 0
         jb.start_build()
@@ -68,9 +67,8 @@ def test_build_inequality(jenkins_env):
         assert bld1 != 1
 
 
-def test_console_text(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
-    expected_job_name = "test_console_text_job"
+def test_console_text(jk):
+    expected_job_name = unique_name("test_console_text_job")
     jb = jk.create_job(expected_job_name, FreestyleJob)
     with clean_job(jb):
         jb.quiet_period = 0
@@ -84,15 +82,14 @@ def test_console_text(jenkins_env):
 
         # Trigger a build and wait for it to complete
         jb.start_build()
-        async_assert(lambda: jb.last_build)
+        bld = async_assert_build(jb)
 
-        assert expected_output in jb.last_build.console_output
+        assert expected_output in bld.console_output
 
 
 @pytest.mark.timeout(10)
-def test_abort(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
-    expected_job_name = "test_abort"
+def test_abort(jk):
+    expected_job_name = unique_name("test_abort")
     jb = jk.create_job(expected_job_name, FreestyleJob)
 
     with clean_job(jb):
@@ -104,11 +101,9 @@ def test_abort(jenkins_env):
         # copy of the config.xml for the job
         async_assert(lambda: jk.find_job(expected_job_name).builders)
 
-        # Trigger a build and wait for it to complete
+        # Trigger a build and wait for it to start running our script
         jb.start_build()
-        async_assert(lambda: jb.last_build)
-
-        async_assert(lambda: "waiting for sleep" in jb.last_build.console_output)
+        async_assert_build(jb, 10, "waiting for sleep")
 
         jb.last_build.abort()
 
@@ -116,5 +111,30 @@ def test_abort(jenkins_env):
         assert jb.last_build.result == "ABORTED"
 
 
+def test_console_output_since(mock_session):
+    response = mock_session.get.return_value
+    response.text = "more output"
+    response.headers = {"X-Text-Size": "42", "X-More-Data": "true"}
+    api = JenkinsAPI("https://0.0.0.0/job/MyJob/1", None, True)
+
+    res = Build(api).get_console_output_since(30)
+
+    assert res == ("more output", 42, True)
+    mock_session.get.assert_called_once_with(
+        "https://0.0.0.0/job/MyJob/1/logText/progressiveText",
+        params={"start": 30})
+
+
+def test_console_output_since_complete(mock_session):
+    response = mock_session.get.return_value
+    response.text = ""
+    response.headers = {"X-Text-Size": "42"}
+    api = JenkinsAPI("https://0.0.0.0/job/MyJob/1", None, True)
+
+    res = Build(api).get_console_output_since(42)
+
+    assert res == ("", 42, False)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -1,16 +1,14 @@
 import pytest
 from mock import MagicMock
-from .utils import async_assert, clean_job
+from .utils import async_assert, clean_job, unique_name
 from requests.exceptions import HTTPError
-from pyjen.jenkins import Jenkins
 from pyjen.queue_item import QueueItem
 from pyjen.plugins.freestylejob import FreestyleJob
 
 
-def test_waiting_build_queue(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
+def test_waiting_build_queue(jk):
     queue = jk.build_queue
-    jb = jk.create_job("test_waiting_build_queue", FreestyleJob)
+    jb = jk.create_job(unique_name("test_waiting_build_queue"), FreestyleJob)
     with clean_job(jb):
         jb.quiet_period = 5
         jb.start_build()
@@ -23,10 +21,9 @@ def test_waiting_build_queue(jenkins_env):
         assert qjob == jb
 
 
-def test_out_of_queue(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
+def test_out_of_queue(jk):
     queue = jk.build_queue
-    jb = jk.create_job("test_waiting_build_queue", FreestyleJob)
+    jb = jk.create_job(unique_name("test_out_of_queue"), FreestyleJob)
     with clean_job(jb):
         jb.quiet_period = 1
         jb.start_build()
@@ -40,10 +37,9 @@ def test_out_of_queue(jenkins_env):
         assert item.waiting is False
 
 
-def test_cancel_queued_build(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
+def test_cancel_queued_build(jk):
     queue = jk.build_queue
-    jb = jk.create_job("test_cancel_queued_build", FreestyleJob)
+    jb = jk.create_job(unique_name("test_cancel_queued_build"), FreestyleJob)
     with clean_job(jb):
         jb.quiet_period = 10
         jb.start_build()
@@ -56,10 +52,9 @@ def test_cancel_queued_build(jenkins_env):
         assert item.cancelled is True
 
 
-def test_get_build_after_queued(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
+def test_get_build_after_queued(jk):
     queue = jk.build_queue
-    jb = jk.create_job("test_get_build_after_queued", FreestyleJob)
+    jb = jk.create_job(unique_name("test_get_build_after_queued"), FreestyleJob)
     with clean_job(jb):
         jb.quiet_period = 1
         jb.start_build()
@@ -73,10 +68,10 @@ def test_get_build_after_queued(jenkins_env):
         assert item.build == jb.last_build
 
 
-def test_start_build_returned_queue_item(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
+def test_start_build_returned_queue_item(jk):
     queue = jk.build_queue
-    jb = jk.create_job("test_start_build_returned_queue_item", FreestyleJob)
+    jb = jk.create_job(
+        unique_name("test_start_build_returned_queue_item"), FreestyleJob)
     with clean_job(jb):
         jb.quiet_period = 1
         item = jb.start_build()
@@ -86,9 +81,8 @@ def test_start_build_returned_queue_item(jenkins_env):
         assert queue.items[0] == item
 
 
-def test_queue_get_build(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
-    jb = jk.create_job("test_queue_get_build", FreestyleJob)
+def test_queue_get_build(jk):
+    jb = jk.create_job(unique_name("test_queue_get_build"), FreestyleJob)
     with clean_job(jb):
         jb.quiet_period = 0
         item = jb.start_build()
@@ -100,9 +94,8 @@ def test_queue_get_build(jenkins_env):
         assert bld == jb.last_build
 
 
-def test_is_valid(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
-    jb = jk.create_job("test_is_valid", FreestyleJob)
+def test_is_valid(jk):
+    jb = jk.create_job(unique_name("test_is_valid"), FreestyleJob)
     with clean_job(jb):
         jb.quiet_period = 0
         item = jb.start_build()
@@ -114,9 +107,8 @@ def test_is_valid(jenkins_env):
 
 
 @pytest.mark.skip("Disabling long-running sanity test")
-def test_is_not_valid(jenkins_env):
-    jk = Jenkins(jenkins_env["url"], (jenkins_env["admin_user"], jenkins_env["admin_token"]))
-    jb = jk.create_job("test_is_not_valid", FreestyleJob)
+def test_is_not_valid(jk):
+    jb = jk.create_job(unique_name("test_is_not_valid"), FreestyleJob)
     from time import sleep
     with clean_job(jb):
         jb.quiet_period = 0
@@ -159,5 +151,16 @@ def test_getters_from_invalid_queue_item():
     assert q1.build is None
 
 
+def test_queue_item_build_preloaded():
+    mock_api = MagicMock()
+    expected_url = "https://0.0.0.0/job/MyJob/3/"
+    mock_api.get_api_data.return_value = {
+        "executable": {"number": 3, "url": expected_url}}
+
+    assert QueueItem(mock_api).build is not None
+
+    mock_api.clone.assert_called_once_with(expected_url, {"number": 3})
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
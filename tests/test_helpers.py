@@ -0,0 +1,46 @@
+import pytest
+from mock import MagicMock
+from pyjen.utils.helpers import parallel_map, create_view, split_names
+from pyjen.plugins.listview import ListView
+
+
+def test_parallel_map_preserves_order():
+    items = list(range(20))
+    res = parallel_map(lambda x: x * 2, items, max_workers=4)
+
+    assert res == [x * 2 for x in items]
+
+
+def test_parallel_map_empty():
+    assert parallel_map(lambda x: x, []) == []
+
+
+def test_parallel_map_raises():
+    def func(item):
+        if item == 3:
+            raise ValueError("bad item")
+        return item
+
+    with pytest.raises(ValueError):
+        parallel_map(func, range(5))
+
+
+def test_split_names():
+    assert split_names("job1") == ["job1"]
+    assert split_names(" job1 ,job2,  job3 ") == ["job1", "job2", "job3"]
+
+
+def test_create_view_direct_url():
+    mock_api = MagicMock()
+    mock_api.url = "https://0.0.0.0/"
+
+    vw = create_view(mock_api, "My View", ListView)
+
+    assert isinstance(vw, ListView)
+    mock_api.clone.assert_called_once_with(
+        "https://0.0.0.0/view/My%20View", {"name": "My View"})
+    mock_api.get_api_data.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -1,5 +1,6 @@
 from pyjen.jenkins import Jenkins
-from mock import MagicMock, patch
+from mock import MagicMock
+from requests.exceptions import HTTPError
 import pytest
 from .utils import clean_view, clean_job
 from pyjen.plugins.listview import ListView
@@ -17,16 +18,121 @@ def test_not_connected():
     assert not jk.connected
 
 
-def test_failed_connection_check():
-    with patch("pyjen.utils.jenkins_api.requests") as req:
-        mock_response = MagicMock()
-        mock_response.headers = None
-        req.get.return_value = mock_response
+def test_failed_connection_check(mock_session):
+    mock_response = MagicMock()
+    mock_response.headers = None
+    mock_session.head.return_value = mock_response
 
-        jk = Jenkins("https://0.0.0.0")
-        assert not jk.connected
+    jk = Jenkins("https://0.0.0.0")
+    assert not jk.connected
+
+    mock_session.head.assert_called_once()
+    mock_session.get.assert_not_called()
+
+
+def test_find_job_trimmed_query(mock_jenkins_api):
+    mock_jenkins_api.get_api_data.return_value = {"jobs": []}
+
+    jk = Jenkins("https://0.0.0.0")
+    assert jk.find_job("DoesNotExistJob") is None
+
+    mock_jenkins_api.get_api_data.assert_called_once_with(
+        query_params="tree=jobs[name,url]", cache=True)
+
+
+def test_find_view_trimmed_query(mock_jenkins_api):
+    mock_jenkins_api.get_api_data.return_value = {
+        "views": [{"name": "all", "url": "https://0.0.0.0/"}]
+    }
+
+    jk = Jenkins("https://0.0.0.0")
+    assert jk.find_view("DoesNotExist") is None
+
+    mock_jenkins_api.get_api_data.assert_called_once_with(
+        query_params="tree=views[name,url]", cache=True)
+    mock_jenkins_api.clone.assert_not_called()
+
+
+def test_find_jobs_bulk(mock_jenkins_api):
+    job_class = FreestyleJob.get_jenkins_plugin_name()
+    mock_jenkins_api.get_api_data.return_value = {"jobs": [
+        {"_class": job_class, "name": "Job1",
+         "url": "https://0.0.0.0/job/Job1/"},
+        {"_class": job_class, "name": "Job2",
+         "url": "https://0.0.0.0/job/Job2/"},
+    ]}
+
+    jk = Jenkins("https://0.0.0.0")
+    res = jk.find_jobs_bulk(["Job2", "DoesNotExist", "Job1"])
+
+    assert isinstance(res[0], FreestyleJob)
+    assert res[1] is None
+    assert isinstance(res[2], FreestyleJob)
+    mock_jenkins_api.get_api_data.assert_called_once_with(
+        query_params="tree=jobs[name,url]", cache=True)
+    mock_jenkins_api.clone.assert_any_call(
+        "https://0.0.0.0/job/Job2/", {"name": "Job2"})
+
+
+def test_bulk_create_jobs(mock_jenkins_api):
+    bad_spec = ("job2", FreestyleJob)
+
+    def mock_post(url, args):
+        if args["params"]["name"] == bad_spec[0]:
+            raise HTTPError("Job already exists")
+    mock_jenkins_api.post.side_effect = mock_post
+
+    specs = [("job1", FreestyleJob), bad_spec, ("job3", FreestyleJob)]
+    jk = Jenkins("https://0.0.0.0")
+    res = jk.bulk_create_jobs(specs, max_workers=2)
+
+    assert [i[0] for i in res] == specs
+    assert isinstance(res[0][1], FreestyleJob)
+    assert isinstance(res[1][1], HTTPError)
+    assert isinstance(res[2][1], FreestyleJob)
+    assert mock_jenkins_api.post.call_count == 3
+
+
+def test_bulk_create_jobs_unexpected_error(mock_jenkins_api):
+    bad_class = MagicMock()
+    bad_class.template_config_xml.side_effect = KeyError("template")
+
+    specs = [("job1", FreestyleJob), ("job2", bad_class)]
+    jk = Jenkins("https://0.0.0.0")
+    res = jk.bulk_create_jobs(specs, max_workers=2)
+
+    assert isinstance(res[0][1], FreestyleJob)
+    assert isinstance(res[1][1], KeyError)
+
+
+def test_nodes_bulk_status(mock_jenkins_api):
+    mock_jenkins_api.get_api_data.return_value = {"computer": [
+        {"displayName": "master", "offline": False, "idle": True,
+         "numExecutors": 2},
+        {"displayName": "agent1", "offline": True, "idle": True,
+         "numExecutors": 1},
+    ]}
+
+    jk = Jenkins("https://0.0.0.0")
+    res = jk.nodes_bulk_status()
+
+    assert [i["offline"] for i in res] == [False, True]
+    assert [i["num_executors"] for i in res] == [2, 1]
+    mock_jenkins_api.get_api_data.assert_called_once()
+    mock_jenkins_api.clone.assert_any_call(
+        "https://0.0.0.0/computer/(master)", {"displayName": "master"})
+
+
+def test_find_node_single_query(mock_jenkins_api):
+    mock_jenkins_api.get_api_data.return_value = {"computer": [
+        {"displayName": "master"}, {"displayName": "agent1"}]}
+
+    jk = Jenkins("https://0.0.0.0")
+    assert jk.find_node("agent1") is not None
+    assert jk.find_node("DoesNotExist") is None
 
-        req.get.assert_called_once()
+    mock_jenkins_api.clone.assert_called_once_with(
+        "https://0.0.0.0/computer/agent1", {"displayName": "agent1"})
 
 
 def test_get_version(jenkins_env):
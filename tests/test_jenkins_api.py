@@ -0,0 +1,291 @@
+import pytest
+from mock import patch
+from pyjen.utils.jenkins_api import JenkinsAPI, parse_json, \
+    VALIDATOR_CACHE_SIZE
+from .utils import json_content
+
+
+def test_preloaded_data(mock_session):
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    expected_name = "MyJob"
+    child = api.clone("https://0.0.0.0/job/MyJob", {"name": expected_name})
+
+    res = child.get_api_data(query_params="tree=name")
+
+    assert res == {"name": expected_name}
+    mock_session.get.assert_not_called()
+
+
+def test_preloaded_data_missing_field(mock_session):
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    child = api.clone("https://0.0.0.0/job/MyJob", {"name": "MyJob"})
+    expected_data = {"color": "blue"}
+    mock_session.get.return_value.content = json_content(expected_data)
+
+    res = child.get_api_data(query_params="tree=color")
+
+    assert res == expected_data
+    mock_session.get.assert_called_once()
+
+
+def test_preloaded_data_not_inherited(mock_session):
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    child = api.clone("https://0.0.0.0/job/MyJob", {"name": "MyJob"})
+    grandchild = child.clone("https://0.0.0.0/job/MyJob/1")
+    mock_session.get.return_value.content = json_content({"name": "1"})
+
+    grandchild.get_api_data(query_params="tree=name")
+
+    mock_session.get.assert_called_once()
+
+
+def test_session_shared_by_clones():
+    with patch("pyjen.utils.jenkins_api.requests") as req:
+        api = JenkinsAPI("https://0.0.0.0", None, True)
+        child = api.clone("https://0.0.0.0/job/MyJob")
+        grandchild = child.clone("https://0.0.0.0/job/MyJob/1")
+
+        assert child.session is api.session
+        assert grandchild.session is api.session
+        req.Session.assert_called_once()
+
+
+def test_clone_state(mock_session):
+    api = JenkinsAPI("https://0.0.0.0", ("user", "token"), True)
+    child = api.clone("https://0.0.0.0/job/MyJob", {"name": "MyJob"})
+
+    assert api.url == "https://0.0.0.0/"
+    assert child.url == "https://0.0.0.0/job/MyJob/"
+    assert child.root_url == api.root_url
+    assert child.session.auth == ("user", "token")
+
+
+def test_headers_shared_by_clones(mock_session):
+    mock_session.head.return_value.headers = {"x-jenkins": "2.1.0"}
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    child = api.clone("https://0.0.0.0/job/MyJob")
+
+    assert child.jenkins_version == (2, 1, 0)
+    assert api.jenkins_version == (2, 1, 0)
+    mock_session.head.assert_called_once()
+
+
+def test_session_settings(mock_session):
+    expected_creds = ("user", "token")
+    expected_cert = "/path/to/ca_bundle"
+    api = JenkinsAPI("https://0.0.0.0", expected_creds, expected_cert)
+
+    assert api.session.auth == expected_creds
+    assert api.session.verify == expected_cert
+
+
+def test_cached_api_data(mock_session):
+    expected_data = {"jobs": []}
+    mock_session.get.return_value.content = json_content(expected_data)
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    child = api.clone("https://0.0.0.0/view/MyView")
+
+    res1 = api.get_api_data(query_params="tree=jobs[name]", cache=True)
+    res2 = child.get_api_data(
+        target_url=api.url, query_params="tree=jobs[name]", cache=True)
+
+    assert res1 == expected_data
+    assert res2 == expected_data
+    mock_session.get.assert_called_once()
+
+
+def test_cached_api_data_shared(mock_session):
+    mock_session.get.return_value.content = json_content({"jobs": []})
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    child = api.clone("https://0.0.0.0/view/MyView")
+
+    res1 = api.get_api_data(query_params="tree=jobs[name]", cache=True)
+    res2 = child.get_api_data(
+        target_url=api.url, query_params="tree=jobs[name]", cache=True)
+
+    assert res1 is res2
+
+
+def test_uncached_api_data(mock_session):
+    mock_session.get.return_value.content = json_content({})
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+
+    api.get_api_data(query_params="tree=jobs[name]", cache=True)
+    api.get_api_data(query_params="tree=jobs[name]")
+
+    assert mock_session.get.call_count == 2
+
+
+def test_post_clears_cache(mock_session):
+    mock_session.get.return_value.content = json_content({})
+    mock_session.head.return_value.headers = {"x-jenkins": "1.0.0"}
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    child = api.clone("https://0.0.0.0/job/MyJob")
+
+    api.get_api_data(query_params="tree=jobs[name]", cache=True)
+    child.post(child.url + "doDelete")
+    mock_session.get.reset_mock()
+    api.get_api_data(query_params="tree=jobs[name]", cache=True)
+
+    mock_session.get.assert_called_once()
+
+
+def test_api_data_url(mock_session):
+    mock_session.get.return_value.content = json_content({})
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+
+    api.get_api_data(
+        target_url="https://0.0.0.0/job/MyJob/5",
+        query_params="tree=number")
+    api.get_api_data(target_url="https://0.0.0.0/job/MyJob/")
+    api.get_api_data()
+
+    urls = [i[0][0] for i in mock_session.get.call_args_list]
+    assert urls == [
+        "https://0.0.0.0/job/MyJob/5/api/json?tree=number",
+        "https://0.0.0.0/job/MyJob/api/json",
+        "https://0.0.0.0/api/json",
+    ]
+
+
+def test_conditional_request(mock_session):
+    expected_data = {"color": "blue"}
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.headers = {"ETag": "1234"}
+    mock_session.get.return_value.content = json_content(expected_data)
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+
+    assert api.get_api_data(query_params="tree=color") == expected_data
+    mock_session.get.return_value.status_code = 304
+    mock_session.get.return_value.content = b""
+    assert api.get_api_data(query_params="tree=color") == expected_data
+
+    _, kwargs = mock_session.get.call_args
+    assert kwargs["headers"] == {"If-None-Match": "1234"}
+
+
+def test_no_validators(mock_session):
+    mock_session.get.return_value.headers = {}
+    mock_session.get.return_value.content = json_content({})
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+
+    api.get_api_data(query_params="tree=color")
+    api.get_api_data(query_params="tree=color")
+
+    _, kwargs = mock_session.get.call_args
+    assert kwargs["headers"] is None
+
+
+def test_conditional_request_returns_copy(mock_session):
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.headers = {"ETag": "1234"}
+    mock_session.get.return_value.content = json_content({"jobs": []})
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+
+    api.get_api_data(query_params="tree=jobs")["jobs"].append("bad")
+    mock_session.get.return_value.status_code = 304
+    mock_session.get.return_value.content = b""
+
+    assert api.get_api_data(query_params="tree=jobs") == {"jobs": []}
+
+
+def test_validators_bounded(mock_session):
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.headers = {"ETag": "1234"}
+    mock_session.get.return_value.content = json_content({})
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+
+    for i in range(VALIDATOR_CACHE_SIZE + 1):
+        api.get_api_data(query_params="tree=job{0}".format(i))
+    api.get_api_data(query_params="tree=job0")
+
+    _, kwargs = mock_session.get.call_args
+    assert kwargs["headers"] is None
+
+
+def test_invalidate_clears_validators(mock_session):
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.headers = {"ETag": "1234"}
+    mock_session.get.return_value.content = json_content({})
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+
+    api.get_api_data(query_params="tree=color")
+    api.invalidate()
+    mock_session.get.return_value.headers = {}
+    api.get_api_data(query_params="tree=color")
+
+    _, kwargs = mock_session.get.call_args
+    assert kwargs["headers"] is None
+
+
+def test_invalidate_cache(mock_session):
+    mock_session.get.return_value.content = json_content({})
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    child = api.clone("https://0.0.0.0/job/MyJob")
+
+    api.get_api_data(query_params="tree=jobs[name]", cache=True)
+    child.invalidate()
+    api.get_api_data(query_params="tree=jobs[name]", cache=True)
+
+    assert mock_session.get.call_count == 2
+
+
+def test_post_does_not_modify_args(mock_session):
+    mock_session.head.return_value.headers = {"x-jenkins": "2.1.0"}
+    mock_session.get.return_value.content = json_content(
+        {"crumbRequestField": "Jenkins-Crumb", "crumb": "1234"})
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    headers = {"Content-Type": "text/xml"}
+    args = {"data": "<xml/>", "headers": headers}
+
+    api.post(api.url + "createItem", args)
+    api.post(api.url + "createItem", args)
+
+    assert args == {
+        "data": "<xml/>", "headers": {"Content-Type": "text/xml"}}
+    _, kwargs = mock_session.post.call_args
+    assert kwargs["headers"] == {
+        "Content-Type": "text/xml", "Jenkins-Crumb": "1234"}
+
+
+def test_headers_head_request(mock_session):
+    mock_session.head.return_value.headers = {"x-jenkins": "2.1.0"}
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+
+    assert api.jenkins_version == (2, 1, 0)
+    mock_session.get.assert_not_called()
+
+
+def test_headers_head_not_supported(mock_session):
+    mock_session.head.return_value.ok = False
+    mock_session.get.return_value.headers = {"x-jenkins": "2.1.0"}
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+
+    assert api.jenkins_version == (2, 1, 0)
+    mock_session.get.assert_called_once()
+
+
+def test_get_raw_streams_response(mock_session):
+    api = JenkinsAPI("https://0.0.0.0/job/MyJob", None, True)
+
+    res = api.get_raw("/config.xml")
+
+    assert res is mock_session.get.return_value.raw
+    assert res.decode_content is True
+    mock_session.get.assert_called_once_with(
+        "https://0.0.0.0/job/MyJob/config.xml", params=None, stream=True)
+
+
+def test_parse_json():
+    expected_data = {"name": "MyJob", "builds": [{"number": 1}]}
+    assert parse_json(json_content(expected_data)) == expected_data
+
+
+def test_parse_json_without_orjson():
+    expected_data = {"name": "MyJob", "builds": [{"number": 1}]}
+    with patch("pyjen.utils.jenkins_api.orjson", None):
+        assert parse_json(json_content(expected_data)) == expected_data
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
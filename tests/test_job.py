@@ -3,8 +3,14 @@ import timeit
 from datetime import datetime
 from datetime import timedelta
 import xml.etree.ElementTree as ElementTree
-from .utils import async_assert, clean_job
+import io
+import time
+from mock import MagicMock
+from requests.exceptions import HTTPError
+from .utils import async_assert, clean_job, json_content
 from pyjen.jenkins import Jenkins
+from pyjen.job import Job
+from pyjen.utils.jenkins_api import JenkinsAPI
 from pyjen.plugins.freestylejob import FreestyleJob
 from pyjen.build import Build
 from pyjen.plugins.buildtriggerpublisher import BuildTriggerPublisher
@@ -608,5 +614,166 @@ def test_find_build_by_queue_id_no_match(jenkins_env):
         assert bld is None
 
 
+def test_all_downstream_jobs_shared_dependencies():
+    job_class = FreestyleJob.get_jenkins_plugin_name()
+    urls = dict((i, "https://0.0.0.0/job/{0}/".format(i)) for i in "abcd")
+
+    def make_deps(*names):
+        return {"downstreamProjects": [
+            {"_class": job_class, "name": i, "url": urls[i]} for i in names]}
+
+    # a -> b -> d, a -> c -> d, d -> a
+    api_data = {
+        urls["a"]: make_deps("b", "c"),
+        urls["b"]: make_deps("d"),
+        urls["c"]: make_deps("d"),
+        urls["d"]: make_deps("a"),
+    }
+    mock_api = MagicMock()
+    mock_api.url = urls["a"]
+    mock_api.get_api_data.side_effect = \
+        lambda target_url, **kwargs: api_data[target_url]
+
+    res = FreestyleJob(mock_api).all_downstream_jobs
+
+    assert len(res) == 3
+    assert all(isinstance(i, FreestyleJob) for i in res)
+    assert mock_api.get_api_data.call_count == 4
+
+
+def test_get_builds_in_time_range_single_request(mock_session):
+    now = int(time.time()) * 1000
+    hour = 60 * 60 * 1000
+    job_url = "https://0.0.0.0/job/MyJob/"
+    api_data = {"allBuilds": [
+        {"number": 3, "timestamp": now, "url": job_url + "3/"},
+        {"number": 2, "timestamp": now - 2 * hour, "url": job_url + "2/"},
+        {"number": 1, "timestamp": now - 4 * hour, "url": job_url + "1/"},
+    ]}
+
+    mock_session.get.return_value.content = json_content(api_data)
+    jb = Job(JenkinsAPI(job_url, None, True))
+
+    start = datetime.fromtimestamp((now - 3 * hour) / 1000)
+    end = datetime.fromtimestamp((now - hour) / 1000)
+    res = jb.get_builds_in_time_range(start, end)
+
+    assert len(res) == 1
+    assert res[0].number == 2
+    assert start <= res[0].start_time <= end
+    mock_session.get.assert_called_once()
+
+
+def test_instantiate_preloads_name(mock_session):
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    json_data = {
+        "_class": FreestyleJob.get_jenkins_plugin_name(),
+        "name": "MyJob",
+        "url": "https://0.0.0.0/job/MyJob/"
+    }
+    jb = Job.instantiate(json_data, api)
+
+    assert isinstance(jb, FreestyleJob)
+    assert jb.name == "MyJob"
+    mock_session.get.assert_not_called()
+
+
+def test_recent_builds_preloaded(mock_session):
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    jb = Job(api.clone("https://0.0.0.0/job/MyJob"))
+    expected_data = {"builds": [
+        {"number": 2, "timestamp": 1500000060000,
+         "url": "https://0.0.0.0/job/MyJob/2/"},
+        {"number": 1, "timestamp": 1500000000000,
+         "url": "https://0.0.0.0/job/MyJob/1/"},
+    ]}
+    mock_session.get.return_value.content = json_content(expected_data)
+
+    builds = jb.recent_builds
+    mock_session.get.reset_mock()
+
+    assert [i.number for i in builds] == [2, 1]
+    assert builds[1].start_time == datetime.fromtimestamp(1500000000)
+    mock_session.get.assert_not_called()
+
+
+def test_clone_nested_job_url(mock_session):
+    mock_session.head.return_value.headers = {"x-jenkins": "1.0.0"}
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    jb = Job(api.clone("https://0.0.0.0/job/MyFolder/job/My%20Job"))
+
+    new_job = jb.clone("MyNewJob", disable=False)
+
+    args, kwargs = mock_session.post.call_args
+    assert args[0] == "https://0.0.0.0/job/MyFolder/createItem"
+    assert kwargs["params"]["from"] == "My Job"
+    assert new_job.name == "MyNewJob"
+    mock_session.get.assert_not_called()
+
+
+def test_clone_disabled_single_post(mock_session):
+    mock_session.head.return_value.headers = {"x-jenkins": "1.0.0"}
+    mock_session.get.return_value.raw = io.BytesIO(
+        FreestyleJob.template_config_xml().encode("utf-8"))
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    jb = FreestyleJob(api.clone("https://0.0.0.0/job/MyJob"))
+
+    jb.clone("MyNewJob")
+
+    mock_session.post.assert_called_once()
+    args, kwargs = mock_session.post.call_args
+    assert args[0] == "https://0.0.0.0/createItem"
+    assert kwargs["params"] == {"name": "MyNewJob"}
+    xml = ElementTree.fromstring(kwargs["data"])
+    assert xml.find("disabled").text == "true"
+
+
+def test_clone_ignores_local_edits(mock_session):
+    mock_session.head.return_value.headers = {"x-jenkins": "1.0.0"}
+    mock_session.get.return_value.raw = io.BytesIO(
+        FreestyleJob.template_config_xml().encode("utf-8"))
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    jb = FreestyleJob(api.clone("https://0.0.0.0/job/MyJob"))
+    local_xml = ElementTree.fromstring(jb.config_xml)
+    ElementTree.SubElement(local_xml, "unsaved").text = "edit"
+    jb._job_xml._cache = local_xml
+    mock_session.get.return_value.raw = io.BytesIO(
+        FreestyleJob.template_config_xml().encode("utf-8"))
+
+    jb.clone("MyNewJob")
+
+    _, kwargs = mock_session.post.call_args
+    xml = ElementTree.fromstring(kwargs["data"])
+    assert xml.find("unsaved") is None
+    assert xml.find("disabled").text == "true"
+
+
+def test_clone_disabled_without_config_access(mock_session):
+    mock_session.head.return_value.headers = {"x-jenkins": "1.0.0"}
+    mock_session.get.return_value.raise_for_status.side_effect = HTTPError(
+        response=MagicMock(status_code=403))
+    api = JenkinsAPI("https://0.0.0.0", None, True)
+    jb = FreestyleJob(api.clone("https://0.0.0.0/job/MyJob"))
+
+    jb.clone("MyNewJob")
+
+    urls = [i[0][0] for i in mock_session.post.call_args_list]
+    assert urls == [
+        "https://0.0.0.0/createItem",
+        "https://0.0.0.0/job/MyNewJob/disable",
+    ]
+    _, kwargs = mock_session.post.call_args_list[0]
+    assert kwargs["params"] == {
+        "name": "MyNewJob", "mode": "copy", "from": "MyJob"}
+
+
+def test_is_disabled_trimmed_query():
+    mock_api = MagicMock()
+    mock_api.get_api_data.return_value = {"color": "disabled"}
+
+    assert Job(mock_api).is_disabled
+    mock_api.get_api_data.assert_called_once_with(query_params="tree=color")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -115,5 +115,14 @@ def test_multiple_upstream_jobs(jenkins_env):
                 assert res[1].name in all_names
 
 
+def test_instantiate_independent_triggers():
+    publisher1 = BuildTriggerPublisher.instantiate(["job1"])
+    publisher2 = BuildTriggerPublisher.instantiate(["job2", "job3"])
+
+    assert publisher1.job_names == ["job1"]
+    assert publisher2.job_names == ["job2", "job3"]
+    assert publisher1.node is not publisher2.node
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -1,5 +1,7 @@
 import pytest
+from mock import MagicMock, patch
 from pyjen.jenkins import Jenkins
+from pyjen.node import Node
 from .utils import clean_job, async_assert
 from pyjen.plugins.shellbuilder import ShellBuilder
 from pyjen.plugins.freestylejob import FreestyleJob
@@ -142,5 +144,16 @@ def test_wait_for_idle_timeout(jenkins_env):
         async_assert(lambda: jb.last_good_build)
 
 
+def test_wait_for_idle_backoff():
+    mock_api = MagicMock()
+    mock_api.get_api_data.side_effect = [{"idle": False}] * 4 + [{"idle": True}]
+
+    with patch("pyjen.node.time.sleep") as mock_sleep:
+        assert Node(mock_api).wait_for_idle(interval=1, max_interval=4)
+
+    assert [i[0][0] for i in mock_sleep.call_args_list] == [1, 2, 4, 4]
+    mock_api.get_api_data.assert_called_with(query_params="tree=idle")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
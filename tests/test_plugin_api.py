@@ -6,7 +6,7 @@ from pyjen.view import View
 from pyjen.job import Job
 
 
-def test_unsupported_plugin(caplog):
+def test_unsupported_plugin(caplog, fresh_plugin_cache):
     with patch("pyjen.utils.plugin_api.iter_entry_points") as entry_points:
         mock_plugin_class = MagicMock(spec=[])
         mock_ep = MagicMock()
@@ -18,7 +18,7 @@ def test_unsupported_plugin(caplog):
         assert "does not expose the required get_jenkins_plugin_name static method" in caplog.text
 
 
-def test_one_supported_plugin(caplog):
+def test_one_supported_plugin(caplog, fresh_plugin_cache):
     with patch("pyjen.utils.plugin_api.iter_entry_points") as entry_points:
         expected_plugin_name = "some_plugin"
         mock_plugin_class = MagicMock()
@@ -35,7 +35,7 @@ def test_one_supported_plugin(caplog):
         assert not caplog.text
 
 
-def test_multiple_supported_plugin(caplog):
+def test_multiple_supported_plugin(caplog, fresh_plugin_cache):
     with patch("pyjen.utils.plugin_api.iter_entry_points") as entry_points:
         expected_plugin_name = "some_plugin"
         mock_plugin_class1 = MagicMock()
@@ -57,6 +57,21 @@ def test_multiple_supported_plugin(caplog):
         assert "multiple plugins detected" in caplog.text
 
 
+def test_plugins_loaded_once(fresh_plugin_cache):
+    with patch("pyjen.utils.plugin_api.iter_entry_points") as entry_points:
+        mock_plugin_class = MagicMock()
+        mock_plugin_class.get_jenkins_plugin_name.return_value = "some_plugin"
+        mock_ep = MagicMock()
+        mock_ep.load.return_value = mock_plugin_class
+        entry_points.return_value = [mock_ep]
+
+        assert find_plugin("some_plugin") == mock_plugin_class
+        assert find_plugin("other_plugin") is None
+        assert get_all_plugins() == [mock_plugin_class]
+
+        entry_points.assert_called_once()
+
+
 def test_list_plugins():
     res = get_all_plugins()
     assert res is not None
@@ -88,6 +103,7 @@ def test_load_all_view_plugins():
     assert len(plugins) > 0
 
     mock_api = MagicMock()
+    mock_api.url = "https://0.0.0.0/"
     expected_name = "FakeName"
     mock_api.get_api_data.return_value = {
         "name": expected_name
@@ -1,4 +1,6 @@
 from pyjen.jenkins import Jenkins
+from pyjen.view import View
+from mock import MagicMock
 import pytest
 from .utils import clean_view, clean_job
 from pyjen.plugins.listview import ListView
@@ -148,5 +150,110 @@ def test_rename_view(jenkins_env):
         assert tmp_view.name == expected_name
 
 
+def test_get_jobs_trimmed_query():
+    mock_api = MagicMock()
+    mock_api.get_api_data.return_value = {"jobs": [{
+        "_class": FreestyleJob.get_jenkins_plugin_name(),
+        "name": "MyJob",
+        "url": "https://0.0.0.0/job/MyJob/"
+    }]}
+
+    res = View(mock_api).jobs
+
+    assert len(res) == 1
+    assert isinstance(res[0], FreestyleJob)
+    mock_api.get_api_data.assert_called_once_with(
+        query_params="tree=jobs[name,url]", cache=True)
+
+
+def test_view_metrics_single_query():
+    mock_api = MagicMock()
+    job_class = FreestyleJob.get_jenkins_plugin_name()
+    mock_api.get_api_data.return_value = {"jobs": [
+        {"_class": job_class, "name": "Job1",
+         "url": "https://0.0.0.0/job/Job1/", "color": "red"},
+        {"_class": job_class, "name": "Job2",
+         "url": "https://0.0.0.0/job/Job2/", "color": "blue"},
+        {"_class": job_class, "name": "Job3",
+         "url": "https://0.0.0.0/job/Job3/", "color": "disabled"},
+        {"_class": job_class, "name": "Job4",
+         "url": "https://0.0.0.0/job/Job4/", "color": "yellow"},
+        {"_class": job_class, "name": "Job5",
+         "url": "https://0.0.0.0/job/Job5/", "color": "red"},
+    ]}
+
+    res = View(mock_api).view_metrics
+
+    assert res["broken_jobs_count"] == 2
+    assert res["disabled_jobs_count"] == 1
+    assert res["unstable_jobs_count"] == 1
+    assert len(res["broken_jobs"]) == 2
+    mock_api.get_api_data.assert_called_once_with(
+        query_params="tree=jobs[name,url,color]")
+
+
+def test_delete_all_jobs_concurrent():
+    mock_api = MagicMock()
+    job_class = FreestyleJob.get_jenkins_plugin_name()
+    mock_api.get_api_data.return_value = {"jobs": [
+        {"_class": job_class, "name": "Job" + str(i),
+         "url": "https://0.0.0.0/job/Job" + str(i) + "/"}
+        for i in range(5)
+    ]}
+    job_apis = dict()
+
+    def mock_clone(url, preloaded_data=None):
+        job_apis[url] = MagicMock(url=url)
+        return job_apis[url]
+    mock_api.clone.side_effect = mock_clone
+
+    View(mock_api).delete_all_jobs(max_workers=3)
+
+    assert len(job_apis) == 5
+    for url, job_api in job_apis.items():
+        job_api.post.assert_called_once_with(url + "doDelete")
+
+
+def test_delete_all_jobs_bulk():
+    mock_api = MagicMock()
+    mock_api.root_url = "https://0.0.0.0/"
+    mock_api.get_api_data.return_value = {"jobs": [
+        {"fullName": "Job1"}, {"fullName": "MyFolder/Job2"}]}
+    mock_api.post.return_value.text = "pyjen-bulk-delete-complete\n"
+
+    View(mock_api).delete_all_jobs(bulk=True)
+
+    mock_api.post.assert_called_once()
+    args, _ = mock_api.post.call_args
+    assert args[0] == "https://0.0.0.0/scriptText"
+    assert '"MyFolder/Job2"' in args[1]["data"]["script"]
+    mock_api.clone.assert_not_called()
+
+
+def test_delete_all_jobs_bulk_fallback():
+    mock_api = MagicMock()
+    mock_api.root_url = "https://0.0.0.0/"
+    mock_api.get_api_data.return_value = {"jobs": [{
+        "_class": FreestyleJob.get_jenkins_plugin_name(),
+        "fullName": "Job1",
+        "name": "Job1",
+        "url": "https://0.0.0.0/job/Job1/"
+    }]}
+    mock_api.post.return_value.text = "groovy.lang.MissingMethodException"
+
+    View(mock_api).delete_all_jobs(bulk=True)
+
+    mock_api.clone.return_value.post.assert_called_once_with(
+        mock_api.clone.return_value.url + "doDelete")
+
+
+def test_get_name_from_url():
+    mock_api = MagicMock()
+    mock_api.url = "https://0.0.0.0/view/MyParent/view/My%20View/"
+
+    assert View(mock_api).name == "My View"
+    mock_api.get_api_data.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -1,5 +1,6 @@
 from pyjen.jenkins import Jenkins
 import pytest
+from mock import MagicMock
 from pyjen.plugins.nestedview import NestedView
 from pyjen.plugins.listview import ListView
 from ..utils import clean_view
@@ -192,5 +193,107 @@ def test_rename_view(jenkins_env):
             assert tmp_view[0].name == expected_name
 
 
+def test_find_all_views_loads_each_view_once():
+    nested_class = NestedView.get_jenkins_plugin_name()
+    list_class = ListView.get_jenkins_plugin_name()
+    root_url = "https://0.0.0.0/view/parent/"
+    child_url = root_url + "view/child/"
+    api_data = {
+        root_url: {"views": [
+            {"_class": nested_class, "name": "child", "url": child_url},
+        ]},
+        child_url: {"views": [
+            {"_class": list_class, "name": "match",
+             "url": child_url + "view/match/"},
+            {"_class": nested_class, "name": "loop", "url": root_url},
+        ]}
+    }
+
+    mock_api = MagicMock()
+    mock_api.url = root_url
+    mock_api.get_api_data.side_effect = \
+        lambda target_url=root_url, **kwargs: api_data[target_url]
+
+    res = NestedView(mock_api).find_all_views("match")
+
+    assert len(res) == 1
+    assert isinstance(res[0], ListView)
+    assert mock_api.get_api_data.call_count == 2
+
+
+def test_all_views_nested_query():
+    nested_class = NestedView.get_jenkins_plugin_name()
+    list_class = ListView.get_jenkins_plugin_name()
+    root_url = "https://0.0.0.0/view/parent/"
+    deep_url = root_url + "view/a/view/b/view/c/"
+    api_data = {
+        root_url: {"views": [
+            {"_class": list_class, "name": "list1",
+             "url": root_url + "view/list1/"},
+            {"_class": nested_class, "name": "a",
+             "url": root_url + "view/a/", "views": [
+                {"_class": nested_class, "name": "b",
+                 "url": root_url + "view/a/view/b/", "views": [
+                    {"_class": nested_class, "name": "c", "url": deep_url},
+                ]},
+            ]},
+            {"_class": list_class, "name": "list3",
+             "url": root_url + "view/list3/"},
+        ]},
+        deep_url: {"views": [
+            {"_class": list_class, "name": "list2",
+             "url": deep_url + "view/list2/"},
+        ]}
+    }
+
+    mock_api = MagicMock()
+    mock_api.url = root_url
+    mock_api.get_api_data.side_effect = \
+        lambda target_url, **kwargs: api_data[target_url]
+
+    res = NestedView(mock_api).all_views
+
+    names = [i[0][1]["name"] for i in mock_api.clone.call_args_list]
+    assert names == ["list1", "a", "b", "c", "list2", "list3"]
+    assert len(res) == 6
+    assert mock_api.get_api_data.call_count == 2
+
+
+def test_all_views_no_duplicates():
+    nested_class = NestedView.get_jenkins_plugin_name()
+    list_class = ListView.get_jenkins_plugin_name()
+    root_url = "https://0.0.0.0/view/parent/"
+    shared_url = root_url + "view/shared/"
+    api_data = {
+        root_url: {"views": [
+            {"_class": list_class, "name": "shared", "url": shared_url},
+            {"_class": nested_class, "name": "a",
+             "url": root_url + "view/a/", "views": [
+                {"_class": list_class, "name": "shared", "url": shared_url},
+                {"_class": nested_class, "name": "parent", "url": root_url},
+            ]},
+        ]},
+    }
+
+    mock_api = MagicMock()
+    mock_api.url = root_url
+    mock_api.get_api_data.side_effect = \
+        lambda target_url, **kwargs: api_data[target_url]
+
+    res = NestedView(mock_api).all_views
+
+    assert len(res) == 2
+    mock_api.get_api_data.assert_called_once()
+
+
+def test_plugin_name_without_config_xml():
+    mock_api = MagicMock()
+
+    assert NestedView(mock_api).jenkins_plugin_name == \
+        "hudson.plugins.nested__view.NestedView"
+    mock_api.get_raw.assert_not_called()
+    mock_api.get_text.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
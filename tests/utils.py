@@ -1,6 +1,8 @@
 """helper functions used by the tests"""
 import os
+import json
 import glob
+import random
 import time
 from contextlib import contextmanager
 
@@ -41,12 +43,19 @@ def clean_view(jenkins_view, disable=False):
             jenkins_view.delete()
 
 
-def async_assert(test_func, duration=10):
+def async_assert(test_func, duration=10, initial_interval=0.1,
+                 max_interval=2):
     """Runs a test function periodically
 
     Used to test asynchronous test operations that may take some time to
     complete.
 
+    The test function is evaluated immediately, and then repeatedly with a
+    short but gradually increasing delay between attempts, so operations that
+    complete quickly are detected quickly while slower operations don't flood
+    the Jenkins service with requests. A small amount of random jitter is
+    added to each delay.
+
     example: async_test(lambda: job.is_healthy)
 
     :param test_func:
@@ -58,12 +67,101 @@ def async_assert(test_func, duration=10):
     :param int duration:
         number of seconds to wait to see if the operation completes
         Defaults to 10 seconds
+    :param float initial_interval:
+        number of seconds to wait after the first failed check.
+        Defaults to 0.1 seconds
+    :param float max_interval:
+        maximum number of seconds to wait between checks.
+        Defaults to 2 seconds
+    :returns: the truthy value returned by the test function
+    """
+    deadline = time.time() + duration
+    interval = initial_interval
+    while True:
+        retval = test_func()
+        if retval:
+            return retval
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+        delay = interval + random.uniform(0, interval * 0.1)
+        time.sleep(min(delay, remaining))
+        interval = min(max_interval, interval * 1.5)
+
+    retval = test_func()
+    assert retval
+    return retval
+
+
+def async_assert_build(job, duration=60, expected_text=None):
+    """Waits for the most recent build of a job to complete
+
+    Rather than repeatedly querying the state of the build, the console log
+    for the build is followed using the progressive text API provided by
+    Jenkins. Each request only returns the output produced since the previous
+    one did, and Jenkins reports when no more output will be produced, which
+    signals that the build has finished.
+
+    example: bld = async_assert_build(job)
+
+    :param job: Jenkins job to monitor for builds
+    :type job: :class:`pyjen.job.Job`
+    :param int duration:
+        number of seconds to wait for the build to complete.
+        Defaults to 60 seconds
+    :param str expected_text:
+        optional text to look for in the console output of the build. When
+        provided, this helper returns as soon as the text appears in the
+        output, even if the build is still running
+    :returns: reference to the build that was monitored
+    :rtype: :class:`pyjen.build.Build`
     """
-    for i in range(duration):
-        if test_func():
+    deadline = time.time() + duration
+    bld = async_assert(lambda: job.last_build, duration)
+
+    output = ""
+    offset = 0
+    while True:
+        new_output, offset, more_data = bld.get_console_output_since(offset)
+        output += new_output
+
+        if expected_text is not None and expected_text in output:
+            return bld
+        remaining = deadline - time.time()
+        if not more_data or remaining <= 0:
             break
-        time.sleep(1)
-    assert test_func()
+        time.sleep(min(0.5, remaining))
+
+    if expected_text is not None:
+        assert expected_text in output
+    assert not bld.is_building
+    return bld
+
+
+def unique_name(name):
+    """Generates a name for a Jenkins entity that is unique to the test worker
+
+    When the tests are distributed across several processes using
+    pytest-xdist, the ID of the worker is appended to the name so concurrent
+    tests never operate on the same job. Otherwise the name is returned as-is.
+
+    :param str name: base name for the entity
+    :rtype: :class:`str`
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker_id:
+        return name
+    return "{0}_{1}".format(name, worker_id)
+
+
+def json_content(data):
+    """Encodes data the same way it is encoded in REST API responses
+
+    :param data: data to encode
+    :returns: JSON encoded data
+    :rtype: :class:`bytes`
+    """
+    return json.dumps(data).encode("utf-8")
 
 
 def count_plugins():